@@ -1,7 +1,7 @@
 '''
 This module is the API for Aviary aircraft analysis code
 
-For users: All built-in Aviary functions, code, and objects 
+For users: All built-in Aviary functions, code, and objects
 should be imported from this file.
 
 For developers: All Aviary code which is intended to be
@@ -14,132 +14,209 @@ user-facing should be imported to this file.
 # TODO: import examples once we settle on those
 # TODO: import this in all user-facing files
 
+import importlib
 
 ###################
 # General Imports #
 ###################
 
+# these modules are cheap to import, so they are always loaded eagerly
 from aviary.variable_info.variables import Aircraft, Mission, Dynamic, Settings
-from aviary.variable_info.options import get_option_defaults, is_option
-from aviary.utils.develop_metadata import add_meta_data, update_meta_data
-from aviary.variable_info.variable_meta_data import CoreMetaData
-from aviary.variable_info.functions import add_aviary_input, add_aviary_output, get_units, override_aviary_vars, setup_trajectory_params
-from aviary.utils.merge_hierarchies import merge_hierarchies
-from aviary.utils.merge_variable_metadata import merge_meta_data
 from aviary.utils.named_values import NamedValues, get_keys, get_items, get_values
-from aviary.utils.aviary_values import AviaryValues
-from aviary.utils.csv_data_file import read_data_file, write_data_file
-from aviary.utils.data_interpolator_builder import build_data_interpolator
 from aviary.variable_info.enums import AlphaModes, AnalysisScheme, ProblemType, SpeedType, GASPEngineType, FlapType, EquationsOfMotion, LegacyCode, Verbosity
-from aviary.interface.default_phase_info.two_dof import phase_info as default_2DOF_phase_info
-from aviary.interface.default_phase_info.two_dof_fiti import phase_info as default_2DOF_fiti_phase_info
-from aviary.interface.default_phase_info.two_dof_fiti_deprecated import create_2dof_based_ascent_phases, create_2dof_based_descent_phases
-from aviary.interface.default_phase_info.height_energy import phase_info as default_height_energy_phase_info
-from aviary.interface.methods_for_level1 import run_level_1
-from aviary.interface.methods_for_level1 import run_aviary
-from aviary.interface.methods_for_level2 import AviaryProblem
-from aviary.interface.utils.check_phase_info import check_phase_info
-from aviary.utils.engine_deck_conversion import EngineDeckConverter
-from aviary.utils.fortran_to_aviary import create_aviary_deck
-from aviary.utils.functions import set_aviary_initial_values, get_path
-from aviary.utils.options import list_options
 from aviary.constants import GRAV_METRIC_GASP, GRAV_ENGLISH_GASP, GRAV_METRIC_FLOPS, GRAV_ENGLISH_FLOPS, GRAV_ENGLISH_LBM, RHO_SEA_LEVEL_ENGLISH, RHO_SEA_LEVEL_METRIC, MU_TAKEOFF, MU_LANDING, PSLS_PSF, TSLS_DEGR, RADIUS_EARTH_METRIC
-from aviary.subsystems.test.subsystem_tester import TestSubsystemBuilderBase, skipIfMissingDependencies
-from aviary.subsystems.propulsion.utils import build_engine_deck
-
-###################
-# Level 3 Imports #
-###################
-
-# Miscellaneous
-from aviary.interface.methods_for_level2 import PreMissionGroup, PostMissionGroup
-from aviary.mission.gasp_based.flight_conditions import FlightConditions
-from aviary.subsystems.premission import CorePreMission
-from aviary.subsystems.subsystem_builder_base import SubsystemBuilderBase
-from aviary.utils.preprocessors import preprocess_options, preprocess_propulsion
-from aviary.utils.process_input_decks import create_vehicle
-from aviary.utils.functions import create_opts2vals, add_opts2vals, Null
-from aviary.variable_info.variables_in import VariablesIn
-from aviary.utils.preprocessors import preprocess_crewpayload
-
-# ODEs
-# TODO: check and see if this works with both sides, or just GASP
-from aviary.mission.gasp_based.ode.base_ode import BaseODE
-from aviary.mission.flops_based.ode.landing_ode import LandingODE as DetailedLandingODE
-from aviary.mission.flops_based.ode.landing_ode import FlareODE as DetailedFlareODE
-from aviary.mission.flops_based.ode.takeoff_ode import TakeoffODE as DetailedTakeoffODE
-from aviary.mission.gasp_based.ode.accel_ode import AccelODE as TwoDOFAccelerationODE
-from aviary.mission.gasp_based.ode.ascent_ode import AscentODE as TwoDOFAscentODE
-from aviary.mission.gasp_based.ode.breguet_cruise_ode import BreguetCruiseODESolution
-from aviary.mission.gasp_based.ode.climb_ode import ClimbODE as TwoDOFClimbODE
-from aviary.mission.gasp_based.ode.descent_ode import DescentODE as TwoDOFDescentODE
-from aviary.mission.gasp_based.ode.flight_path_ode import FlightPathODE as TwoDOFFlightPathODE
-from aviary.mission.gasp_based.ode.groundroll_ode import GroundrollODE as TwoDOFGroundrollODE
-from aviary.mission.gasp_based.ode.rotation_ode import RotationODE as TwoDOFRotationODE
-from aviary.mission.gasp_based.phases.landing_group import LandingSegment as TwoDOFSimplifiedLanding
-from aviary.mission.gasp_based.phases.taxi_group import TaxiSegment as AnalyticTaxi
-from aviary.mission.flops_based.phases.simplified_takeoff import TakeoffGroup as HeightEnergySimplifiedTakeoff
-from aviary.mission.flops_based.phases.simplified_landing import LandingGroup as HeightEnergySimplifiedLanding
-
-
-# Phase builders
-from aviary.mission.phase_builder_base import PhaseBuilderBase
-# note that this is only for simplified right now
-from aviary.mission.energy_phase import EnergyPhase as HeightEnergyPhaseBuilder
-from aviary.mission.flops_based.phases.build_landing import Landing as HeightEnergyLandingPhaseBuilder
-# note that this is only for simplified right now
-from aviary.mission.flops_based.phases.build_takeoff import Takeoff as HeightEnergyTakeoffPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingApproachToMicP3 as DetailedLandingApproachToMicP3PhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingMicP3ToObstacle as DetailedLandingMicP3ToObstaclePhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingObstacleToFlare as DetailedLandingObstacleToFlarePhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingFlareToTouchdown as DetailedLandingFlareToTouchdownPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingTouchdownToNoseDown as DetailedLandingTouchdownToNoseDownPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingNoseDownToStop as DetailedLandingNoseDownToStopPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffBrakeReleaseToDecisionSpeed as DetailedTakeoffBrakeReleaseToDecisionSpeedPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffDecisionSpeedToRotate as DetailedTakeoffDecisionSpeedToRotatePhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffDecisionSpeedBrakeDelay as DetailedTakeoffDecisionSpeedBrakeDelayPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffRotateToLiftoff as DetailedTakeoffRotateToLiftoffPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffLiftoffToObstacle as DetailedTakeoffLiftoffToObstaclePhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffObstacleToMicP2 as DetailedTakeoffObstacleToMicP2PhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffMicP2ToEngineCutback as DetailedTakeoffMicP2ToEngineCutbackPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffEngineCutback as DetailedTakeoffEngineCutbackPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffEngineCutbackToMicP1 as DetailedTakeoffEngineCutbackToMicP1PhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffMicP1ToClimb as DetailedTakeoffMicP1ToClimbPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffBrakeToAbort as DetailedTakeoffBrakeToAbortPhaseBuilder
-
-# Phase builders
-from aviary.mission.gasp_based.phases.accel_phase import AccelPhase as TwoDOFAccelerationPhase
-from aviary.mission.gasp_based.phases.ascent_phase import AscentPhase as TwoDOFAscentPhase
-from aviary.mission.gasp_based.phases.climb_phase import ClimbPhase as TwoDOFClimbPhase
-from aviary.mission.gasp_based.phases.descent_phase import DescentPhase as TwoDOFDescentPhase
-from aviary.mission.gasp_based.phases.groundroll_phase import GroundrollPhase as TwoDOFGroundrollPhase
-from aviary.mission.gasp_based.phases.rotation_phase import RotationPhase as TwoDOFRotationPhase
-
-
-# Trajectory builders
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingTrajectory as DetailedLandingTrajectoryBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffTrajectory as DetailedTakeoffTrajectoryBuilder
-
-# SimuPy
-from aviary.mission.gasp_based.ode.time_integration_base_classes import SimuPyProblem
-from aviary.mission.gasp_based.phases.time_integration_phases import SGMGroundroll, SGMRotation, SGMAscent, SGMAscentCombined, SGMAccel, SGMClimb, SGMCruise, SGMDescent
-from aviary.mission.gasp_based.phases.time_integration_traj import TimeIntegrationTrajBase, FlexibleTraj
-
-# Aerodynamics
-from aviary.subsystems.aerodynamics.aerodynamics_builder import AerodynamicsBuilderBase
-from aviary.subsystems.aerodynamics.aerodynamics_builder import CoreAerodynamicsBuilder
-from aviary.subsystems.aerodynamics.flops_based.tabular_aero_group import TabularAeroGroup
-
-# Geometry
-from aviary.subsystems.geometry.geometry_builder import GeometryBuilderBase
-from aviary.subsystems.geometry.geometry_builder import CoreGeometryBuilder
-
-# Mass
-from aviary.subsystems.mass.mass_builder import MassBuilderBase
-from aviary.subsystems.mass.mass_builder import CoreMassBuilder
-
-# Propulsion
-from aviary.subsystems.propulsion.engine_deck import EngineDeck
-from aviary.subsystems.propulsion.engine_model import EngineModel
-from aviary.subsystems.propulsion.propulsion_builder import PropulsionBuilderBase
-from aviary.subsystems.propulsion.propulsion_builder import CorePropulsionBuilder
+from aviary.mission import _ode_registry
+
+# Everything else is only imported the first time it is accessed from this module,
+# so that e.g. using Aircraft or run_level_1 does not pull in every ODE, phase builder,
+# and subsystem in Aviary. Each entry maps the exported name to
+# (module path, attribute name).
+_lazy_imports = {
+    'get_option_defaults': ('aviary.variable_info.options', 'get_option_defaults'),
+    'is_option': ('aviary.variable_info.options', 'is_option'),
+    'add_meta_data': ('aviary.utils.develop_metadata', 'add_meta_data'),
+    'update_meta_data': ('aviary.utils.develop_metadata', 'update_meta_data'),
+    'CoreMetaData': ('aviary.variable_info.variable_meta_data', 'CoreMetaData'),
+    'add_aviary_input': ('aviary.variable_info.functions', 'add_aviary_input'),
+    'add_aviary_output': ('aviary.variable_info.functions', 'add_aviary_output'),
+    'get_units': ('aviary.variable_info.functions', 'get_units'),
+    'override_aviary_vars': ('aviary.variable_info.functions', 'override_aviary_vars'),
+    'setup_trajectory_params': ('aviary.variable_info.functions', 'setup_trajectory_params'),
+    'merge_hierarchies': ('aviary.utils.merge_hierarchies', 'merge_hierarchies'),
+    'merge_meta_data': ('aviary.utils.merge_variable_metadata', 'merge_meta_data'),
+    'AviaryValues': ('aviary.utils.aviary_values', 'AviaryValues'),
+    'read_data_file': ('aviary.utils.csv_data_file', 'read_data_file'),
+    'write_data_file': ('aviary.utils.csv_data_file', 'write_data_file'),
+    'build_data_interpolator': ('aviary.utils.data_interpolator_builder', 'build_data_interpolator'),
+    'default_2DOF_phase_info': ('aviary.interface.default_phase_info.two_dof', 'phase_info'),
+    'default_2DOF_fiti_phase_info': ('aviary.interface.default_phase_info.two_dof_fiti', 'phase_info'),
+    'create_2dof_based_ascent_phases': ('aviary.interface.default_phase_info.two_dof_fiti_deprecated', 'create_2dof_based_ascent_phases'),
+    'create_2dof_based_descent_phases': ('aviary.interface.default_phase_info.two_dof_fiti_deprecated', 'create_2dof_based_descent_phases'),
+    'default_height_energy_phase_info': ('aviary.interface.default_phase_info.height_energy', 'phase_info'),
+    'run_level_1': ('aviary.interface.methods_for_level1', 'run_level_1'),
+    'run_aviary': ('aviary.interface.methods_for_level1', 'run_aviary'),
+    'AviaryProblem': ('aviary.interface.methods_for_level2', 'AviaryProblem'),
+    'check_phase_info': ('aviary.interface.utils.check_phase_info', 'check_phase_info'),
+    'EngineDeckConverter': ('aviary.utils.engine_deck_conversion', 'EngineDeckConverter'),
+    'create_aviary_deck': ('aviary.utils.fortran_to_aviary', 'create_aviary_deck'),
+    'set_aviary_initial_values': ('aviary.utils.functions', 'set_aviary_initial_values'),
+    'get_path': ('aviary.utils.functions', 'get_path'),
+    'list_options': ('aviary.utils.options', 'list_options'),
+    'TestSubsystemBuilderBase': ('aviary.subsystems.test.subsystem_tester', 'TestSubsystemBuilderBase'),
+    'skipIfMissingDependencies': ('aviary.subsystems.test.subsystem_tester', 'skipIfMissingDependencies'),
+    'build_engine_deck': ('aviary.subsystems.propulsion.utils', 'build_engine_deck'),
+
+
+    # Level 3 imports
+
+    # Miscellaneous
+    'PreMissionGroup': ('aviary.interface.methods_for_level2', 'PreMissionGroup'),
+    'PostMissionGroup': ('aviary.interface.methods_for_level2', 'PostMissionGroup'),
+    'FlightConditions': ('aviary.mission.gasp_based.flight_conditions', 'FlightConditions'),
+    'CorePreMission': ('aviary.subsystems.premission', 'CorePreMission'),
+    'SubsystemBuilderBase': ('aviary.subsystems.subsystem_builder_base', 'SubsystemBuilderBase'),
+    'preprocess_options': ('aviary.utils.preprocessors', 'preprocess_options'),
+    'preprocess_propulsion': ('aviary.utils.preprocessors', 'preprocess_propulsion'),
+    'create_vehicle': ('aviary.utils.process_input_decks', 'create_vehicle'),
+    'create_opts2vals': ('aviary.utils.functions', 'create_opts2vals'),
+    'add_opts2vals': ('aviary.utils.functions', 'add_opts2vals'),
+    'Null': ('aviary.utils.functions', 'Null'),
+    'VariablesIn': ('aviary.variable_info.variables_in', 'VariablesIn'),
+    'preprocess_crewpayload': ('aviary.utils.preprocessors', 'preprocess_crewpayload'),
+
+    # ODEs
+    # NOTE: the ODE classes themselves are served by aviary.mission._ode_registry, see
+    #       ODEs and __getattr__ below
+    'TwoDOFSimplifiedLanding': ('aviary.mission.gasp_based.phases.landing_group', 'LandingSegment'),
+    'AnalyticTaxi': ('aviary.mission.gasp_based.phases.taxi_group', 'TaxiSegment'),
+    'HeightEnergySimplifiedTakeoff': ('aviary.mission.flops_based.phases.simplified_takeoff', 'TakeoffGroup'),
+    'HeightEnergySimplifiedLanding': ('aviary.mission.flops_based.phases.simplified_landing', 'LandingGroup'),
+
+    # Phase builders
+    'PhaseBuilderBase': ('aviary.mission.phase_builder_base', 'PhaseBuilderBase'),
+    # note that this is only for simplified right now
+    'HeightEnergyPhaseBuilder': ('aviary.mission.energy_phase', 'EnergyPhase'),
+    'HeightEnergyLandingPhaseBuilder': ('aviary.mission.flops_based.phases.build_landing', 'Landing'),
+    # note that this is only for simplified right now
+    'HeightEnergyTakeoffPhaseBuilder': ('aviary.mission.flops_based.phases.build_takeoff', 'Takeoff'),
+    'DetailedLandingApproachToMicP3PhaseBuilder': ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingApproachToMicP3'),
+    'DetailedLandingMicP3ToObstaclePhaseBuilder': ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingMicP3ToObstacle'),
+    'DetailedLandingObstacleToFlarePhaseBuilder': ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingObstacleToFlare'),
+    'DetailedLandingFlareToTouchdownPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingFlareToTouchdown'),
+    'DetailedLandingTouchdownToNoseDownPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingTouchdownToNoseDown'),
+    'DetailedLandingNoseDownToStopPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingNoseDownToStop'),
+    'DetailedTakeoffBrakeReleaseToDecisionSpeedPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffBrakeReleaseToDecisionSpeed'),
+    'DetailedTakeoffDecisionSpeedToRotatePhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffDecisionSpeedToRotate'),
+    'DetailedTakeoffDecisionSpeedBrakeDelayPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffDecisionSpeedBrakeDelay'),
+    'DetailedTakeoffRotateToLiftoffPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffRotateToLiftoff'),
+    'DetailedTakeoffLiftoffToObstaclePhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffLiftoffToObstacle'),
+    'DetailedTakeoffObstacleToMicP2PhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffObstacleToMicP2'),
+    'DetailedTakeoffMicP2ToEngineCutbackPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffMicP2ToEngineCutback'),
+    'DetailedTakeoffEngineCutbackPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffEngineCutback'),
+    'DetailedTakeoffEngineCutbackToMicP1PhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffEngineCutbackToMicP1'),
+    'DetailedTakeoffMicP1ToClimbPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffMicP1ToClimb'),
+    'DetailedTakeoffBrakeToAbortPhaseBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffBrakeToAbort'),
+
+    # Phase builders
+    'TwoDOFAccelerationPhase': ('aviary.mission.gasp_based.phases.accel_phase', 'AccelPhase'),
+    'TwoDOFAscentPhase': ('aviary.mission.gasp_based.phases.ascent_phase', 'AscentPhase'),
+    'TwoDOFClimbPhase': ('aviary.mission.gasp_based.phases.climb_phase', 'ClimbPhase'),
+    'TwoDOFDescentPhase': ('aviary.mission.gasp_based.phases.descent_phase', 'DescentPhase'),
+    'TwoDOFGroundrollPhase': ('aviary.mission.gasp_based.phases.groundroll_phase', 'GroundrollPhase'),
+    'TwoDOFRotationPhase': ('aviary.mission.gasp_based.phases.rotation_phase', 'RotationPhase'),
+
+    # Trajectory builders
+    'DetailedLandingTrajectoryBuilder': ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingTrajectory'),
+    'DetailedTakeoffTrajectoryBuilder': ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffTrajectory'),
+
+    # SimuPy
+    'SimuPyProblem': ('aviary.mission.gasp_based.ode.time_integration_base_classes', 'SimuPyProblem'),
+    'SGMGroundroll': ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMGroundroll'),
+    'SGMRotation': ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMRotation'),
+    'SGMAscent': ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMAscent'),
+    'SGMAscentCombined': ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMAscentCombined'),
+    'SGMAccel': ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMAccel'),
+    'SGMClimb': ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMClimb'),
+    'SGMCruise': ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMCruise'),
+    'SGMDescent': ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMDescent'),
+    'TimeIntegrationTrajBase': ('aviary.mission.gasp_based.phases.time_integration_traj', 'TimeIntegrationTrajBase'),
+    'FlexibleTraj': ('aviary.mission.gasp_based.phases.time_integration_traj', 'FlexibleTraj'),
+
+    # Aerodynamics
+    'AerodynamicsBuilderBase': ('aviary.subsystems.aerodynamics.aerodynamics_builder', 'AerodynamicsBuilderBase'),
+    'CoreAerodynamicsBuilder': ('aviary.subsystems.aerodynamics.aerodynamics_builder', 'CoreAerodynamicsBuilder'),
+    'TabularAeroGroup': ('aviary.subsystems.aerodynamics.flops_based.tabular_aero_group', 'TabularAeroGroup'),
+
+    # Geometry
+    'GeometryBuilderBase': ('aviary.subsystems.geometry.geometry_builder', 'GeometryBuilderBase'),
+    'CoreGeometryBuilder': ('aviary.subsystems.geometry.geometry_builder', 'CoreGeometryBuilder'),
+
+    # Mass
+    'MassBuilderBase': ('aviary.subsystems.mass.mass_builder', 'MassBuilderBase'),
+    'CoreMassBuilder': ('aviary.subsystems.mass.mass_builder', 'CoreMassBuilder'),
+
+    # Propulsion
+    'EngineDeck': ('aviary.subsystems.propulsion.engine_deck', 'EngineDeck'),
+    'EngineModel': ('aviary.subsystems.propulsion.engine_model', 'EngineModel'),
+    'PropulsionBuilderBase': ('aviary.subsystems.propulsion.propulsion_builder', 'PropulsionBuilderBase'),
+    'CorePropulsionBuilder': ('aviary.subsystems.propulsion.propulsion_builder', 'CorePropulsionBuilder'),
+}
+
+
+class _LazyODEs:
+    '''
+    Namespace of the built-in ODE classes, e.g. ODEs.TwoDOFClimbODE.
+
+    Each ODE is only imported the first time it is accessed.
+    '''
+
+    def __getattr__(self, name):
+        try:
+            return _ode_registry.get(name)
+
+        except KeyError:
+            raise AttributeError(f"no ODE named '{name}'") from None
+
+    def __dir__(self):
+        return list(_ode_registry.names())
+
+
+# TODO: check and see if the ODEs work with both sides, or just GASP
+ODEs = _LazyODEs()
+
+__all__ = [
+    'Aircraft', 'Mission', 'Dynamic', 'Settings',
+    'NamedValues', 'get_keys', 'get_items', 'get_values',
+    'AlphaModes', 'AnalysisScheme', 'ProblemType', 'SpeedType', 'GASPEngineType',
+    'FlapType', 'EquationsOfMotion', 'LegacyCode', 'Verbosity',
+    'GRAV_METRIC_GASP', 'GRAV_ENGLISH_GASP', 'GRAV_METRIC_FLOPS', 'GRAV_ENGLISH_FLOPS',
+    'GRAV_ENGLISH_LBM', 'RHO_SEA_LEVEL_ENGLISH', 'RHO_SEA_LEVEL_METRIC', 'MU_TAKEOFF',
+    'MU_LANDING', 'PSLS_PSF', 'TSLS_DEGR', 'RADIUS_EARTH_METRIC',
+    'ODEs',
+    *_lazy_imports,
+    *_ode_registry.names(),
+]
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        module_path, attr_name = _lazy_imports[name]
+        value = getattr(importlib.import_module(module_path), attr_name)
+
+    else:
+        # ODEs are also available directly from this module for backwards compatibility
+        try:
+            value = _ode_registry.get(name)
+
+        except KeyError:
+            raise AttributeError(
+                f"module '{__name__}' has no attribute '{name}'") from None
+
+    # cache on the module so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return list(__all__)
@@ -0,0 +1,60 @@
+'''
+Define a lazily loaded registry of the built-in mission ODE classes.
+
+Modules containing ODEs are only imported the first time one of their classes is
+requested, then reused through sys.modules.
+
+Functions
+---------
+get : return the ODE class registered under a name
+names : return the names of all registered ODE classes
+'''
+import importlib
+
+# maps the public name of each ODE to (module path, class name)
+_NAMES = {
+    'BaseODE': ('aviary.mission.gasp_based.ode.base_ode', 'BaseODE'),
+    'DetailedLandingODE': ('aviary.mission.flops_based.ode.landing_ode', 'LandingODE'),
+    'DetailedFlareODE': ('aviary.mission.flops_based.ode.landing_ode', 'FlareODE'),
+    'DetailedTakeoffODE': ('aviary.mission.flops_based.ode.takeoff_ode', 'TakeoffODE'),
+    'TwoDOFAccelerationODE': ('aviary.mission.gasp_based.ode.accel_ode', 'AccelODE'),
+    'TwoDOFAscentODE': ('aviary.mission.gasp_based.ode.ascent_ode', 'AscentODE'),
+    'BreguetCruiseODESolution': (
+        'aviary.mission.gasp_based.ode.breguet_cruise_ode', 'BreguetCruiseODESolution'),
+    'TwoDOFClimbODE': ('aviary.mission.gasp_based.ode.climb_ode', 'ClimbODE'),
+    'TwoDOFDescentODE': ('aviary.mission.gasp_based.ode.descent_ode', 'DescentODE'),
+    'TwoDOFFlightPathODE': (
+        'aviary.mission.gasp_based.ode.flight_path_ode', 'FlightPathODE'),
+    'TwoDOFGroundrollODE': (
+        'aviary.mission.gasp_based.ode.groundroll_ode', 'GroundrollODE'),
+    'TwoDOFRotationODE': ('aviary.mission.gasp_based.ode.rotation_ode', 'RotationODE'),
+}
+
+_loaded = {}
+
+
+def get(name):
+    '''
+    Return the ODE class registered under the specified name.
+
+    Raises
+    ------
+    KeyError
+        if no ODE is registered under the name
+    '''
+    ode_class = _loaded.get(name)
+
+    if ode_class is None:
+        module_path, class_name = _NAMES[name]
+        module = importlib.import_module(module_path)
+
+        ode_class = _loaded[name] = getattr(module, class_name)
+
+    return ode_class
+
+
+def names():
+    '''
+    Return the names of all registered ODE classes.
+    '''
+    return tuple(_NAMES)
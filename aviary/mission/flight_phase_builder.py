@@ -7,7 +7,7 @@ from aviary.mission.initial_guess_builders import InitialGuessState, InitialGues
 
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variable_meta_data import _MetaData
-from aviary.mission.flops_based.phases.phase_utils import add_subsystem_variables_to_phase, get_initial
+from aviary.mission.flops_based.phases.phase_utils import add_subsystem_variables_to_phase, get_initial, get_lgl_segment_ends
 from aviary.variable_info.variables import Aircraft, Dynamic
 from aviary.mission.flops_based.ode.mission_ODE import MissionODE
 from aviary.variable_info.enums import EquationsOfMotion, ThrottleAllocation
@@ -338,7 +338,8 @@ class FlightPhaseBase(PhaseBuilderBase):
                     Dynamic.Mission.THROTTLE, lower=0.0, upper=1.0, units='unitless',
                 )
 
-        self._add_user_defined_constraints(phase, constraints)
+        if constraints:
+            self._add_user_defined_constraints(phase, constraints)
 
         return phase
 
@@ -351,7 +352,7 @@ class FlightPhaseBase(PhaseBuilderBase):
         num_segments, _ = user_options.get_item('num_segments')
         order, _ = user_options.get_item('order')
 
-        seg_ends, _ = dm.utils.lgl.lgl(num_segments + 1)
+        seg_ends = get_lgl_segment_ends(num_segments)
 
         transcription = dm.Radau(
             num_segments=num_segments, order=order, compressed=True,
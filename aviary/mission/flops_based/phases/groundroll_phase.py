@@ -5,11 +5,31 @@ from aviary.mission.initial_guess_builders import InitialGuessState, InitialGues
 
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variable_meta_data import _MetaData
-from aviary.mission.flops_based.phases.phase_utils import add_subsystem_variables_to_phase, get_initial
+from aviary.mission.flops_based.phases.phase_utils import add_subsystem_variables_to_phase, get_initial, get_lgl_segment_ends
 from aviary.variable_info.variables import Dynamic
 from aviary.mission.gasp_based.ode.groundroll_ode import GroundrollODE
 
 
+# (name, units) of the timeseries outputs added to every groundroll phase; units of None
+# keep the units of the ODE output
+_timeseries_outputs = (
+    (Dynamic.Mission.THRUST_TOTAL, 'lbf'),
+    ('thrust_req', 'lbf'),
+    ('normal_force', None),
+    (Dynamic.Mission.MACH, None),
+    ('EAS', 'kn'),
+    ('TAS', 'kn'),
+    (Dynamic.Mission.LIFT, None),
+    (Dynamic.Mission.DRAG, None),
+    ('time', None),
+    ('mass', None),
+    (Dynamic.Mission.ALTITUDE, None),
+    ('alpha', None),
+    (Dynamic.Mission.FLIGHT_PATH_ANGLE, None),
+    (Dynamic.Mission.THROTTLE, None),
+)
+
+
 # TODO: support/handle the following in the base class
 # - phase.set_time_options()
 #     - currently handled in level 3 interface implementation
@@ -32,6 +52,16 @@ class GroundrollPhase(PhaseBuilderBase):
     default_ode_class = GroundrollODE
 
     default_meta_data = _MetaData
+
+    default_initial_guesses = (
+        (InitialGuessIntegrationVariable(key='velocity'),
+         'initial guess for initial velocity and final specified as a tuple'),
+        (InitialGuessPolynomialControl('altitude'),
+         'initial guess for vertical distances'),
+        (InitialGuessState('mass'), 'initial guess for mass'),
+        (InitialGuessState('distance'), 'initial guess for distance'),
+        (InitialGuessState('time'), 'initial guess for time'),
+    )
     # endregion : derived type customization points
 
     def __init__(
@@ -99,22 +129,14 @@ class GroundrollPhase(PhaseBuilderBase):
         phase.add_parameter("wing_area", units="ft**2",
                             static_target=True, opt=False, val=1370)
 
-        self._add_user_defined_constraints(phase, constraints)
-
-        phase.add_timeseries_output(Dynamic.Mission.THRUST_TOTAL, units="lbf")
-        phase.add_timeseries_output("thrust_req", units="lbf")
-        phase.add_timeseries_output("normal_force")
-        phase.add_timeseries_output(Dynamic.Mission.MACH)
-        phase.add_timeseries_output("EAS", units="kn")
-        phase.add_timeseries_output("TAS", units="kn")
-        phase.add_timeseries_output(Dynamic.Mission.LIFT)
-        phase.add_timeseries_output(Dynamic.Mission.DRAG)
-        phase.add_timeseries_output("time")
-        phase.add_timeseries_output("mass")
-        phase.add_timeseries_output(Dynamic.Mission.ALTITUDE)
-        phase.add_timeseries_output("alpha")
-        phase.add_timeseries_output(Dynamic.Mission.FLIGHT_PATH_ANGLE)
-        phase.add_timeseries_output(Dynamic.Mission.THROTTLE)
+        if constraints:
+            self._add_user_defined_constraints(phase, constraints)
+
+        for name, units in _timeseries_outputs:
+            if units is None:
+                phase.add_timeseries_output(name)
+            else:
+                phase.add_timeseries_output(name, units=units)
 
         return phase
 
@@ -127,7 +149,7 @@ class GroundrollPhase(PhaseBuilderBase):
         num_segments, _ = user_options.get_item('num_segments')
         order, _ = user_options.get_item('order')
 
-        seg_ends, _ = dm.utils.lgl.lgl(num_segments + 1)
+        seg_ends = get_lgl_segment_ends(num_segments)
 
         transcription = dm.Radau(
             num_segments=num_segments, order=order, compressed=True,
@@ -179,23 +201,3 @@ GroundrollPhase._add_meta_data('ground_roll', val=True)
 GroundrollPhase._add_meta_data('rotation', val=False)
 GroundrollPhase._add_meta_data('clean', val=False)
 GroundrollPhase._add_meta_data('constraints', val={})
-
-GroundrollPhase._add_initial_guess_meta_data(
-    InitialGuessIntegrationVariable(key='velocity'),
-    desc='initial guess for initial velocity and final specified as a tuple')
-
-GroundrollPhase._add_initial_guess_meta_data(
-    InitialGuessPolynomialControl('altitude'),
-    desc='initial guess for vertical distances')
-
-GroundrollPhase._add_initial_guess_meta_data(
-    InitialGuessState('mass'),
-    desc='initial guess for mass')
-
-GroundrollPhase._add_initial_guess_meta_data(
-    InitialGuessState('distance'),
-    desc='initial guess for distance')
-
-GroundrollPhase._add_initial_guess_meta_data(
-    InitialGuessState('time'),
-    desc='initial guess for time')
@@ -1,5 +1,8 @@
+import functools
 import inspect
 
+import numpy as np
+
 
 def add_subsystem_variables_to_phase(phase, phase_name, external_subsystems):
     """
@@ -69,3 +72,33 @@ def get_initial(status, key, status_for_this_variable=False):
     elif isinstance(status, bool):
         status_for_this_variable = status
     return status_for_this_variable
+
+
+def get_lgl_segment_ends(num_segments):
+    """
+    Return segment end locations spaced at the Legendre-Gauss-Lobatto nodes.
+
+    The LGL nodes only depend on the number of segments, so they are computed once
+    per value of num_segments and reused by every subsequent phase build.
+
+    Parameters
+    ----------
+    num_segments : int
+        The number of transcription segments.
+
+    Returns
+    -------
+    seg_ends : ndarray
+        The num_segments + 1 segment end locations on [-1, 1].
+    """
+    return np.array(_lgl_nodes(num_segments + 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _lgl_nodes(num_nodes):
+    import dymos as dm
+
+    nodes, _ = dm.utils.lgl.lgl(num_nodes)
+
+    # store as a tuple so the cached value cannot be modified by callers
+    return tuple(nodes)
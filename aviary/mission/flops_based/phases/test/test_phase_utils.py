@@ -0,0 +1,26 @@
+import unittest
+
+import dymos as dm
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.mission.flops_based.phases.phase_utils import get_lgl_segment_ends
+
+
+class LGLSegmentEndsTest(unittest.TestCase):
+    def test_matches_dymos(self):
+        for num_segments in (1, 3, 5):
+            expected, _ = dm.utils.lgl.lgl(num_segments + 1)
+
+            assert_near_equal(get_lgl_segment_ends(num_segments), expected, 1e-15)
+
+    def test_cached_value_not_modified(self):
+        seg_ends = get_lgl_segment_ends(5)
+        seg_ends[:] = 0.
+
+        expected, _ = dm.utils.lgl.lgl(6)
+
+        assert_near_equal(get_lgl_segment_ends(5), expected, 1e-15)
+
+
+if __name__ == '__main__':
+    unittest.main()
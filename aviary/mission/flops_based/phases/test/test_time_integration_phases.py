@@ -3,8 +3,7 @@ from openmdao.utils.assert_utils import assert_near_equal
 
 from aviary.interface.methods_for_level2 import AviaryGroup
 from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
-from aviary.mission.flops_based.phases.time_integration_phases import \
-    SGMHeightEnergy, SGMDetailedTakeoff, SGMDetailedLanding
+from aviary.mission.flops_based.phases.time_integration_phases import SGMHeightEnergy
 from aviary.subsystems.premission import CorePreMission
 from aviary.utils.functions import set_aviary_initial_values
 from aviary.variable_info.enums import EquationsOfMotion
@@ -119,7 +118,7 @@ class HE_SGMDescentTestCase(unittest.TestCase):
 
             warnings.simplefilter("ignore", om.PromotionWarning)
 
-            prob.setup()
+            prob.setup(check=False, mode='fwd', force_alloc_complex=False)
 
         return prob
 
@@ -1,9 +1,10 @@
+import functools
 import unittest
 import warnings
 import importlib
+from copy import deepcopy
 
 import openmdao.api as om
-from aviary.interface.default_phase_info.two_dof_fiti_deprecated import create_2dof_based_descent_phases
 from aviary.interface.default_phase_info.two_dof_fiti import descent_phases, add_default_sgm_args
 
 from openmdao.utils.assert_utils import assert_near_equal
@@ -11,18 +12,31 @@ from openmdao.utils.assert_utils import assert_near_equal
 from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.utils.test_utils.default_subsystems import get_default_mission_subsystems
 from aviary.mission.gasp_based.idle_descent_estimation import descent_range_and_fuel, add_descent_estimation_as_submodel
-from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 from aviary.variable_info.enums import Verbosity
 from aviary.utils.process_input_decks import create_vehicle
 from aviary.utils.preprocessors import preprocess_propulsion
 
 
+@functools.lru_cache(maxsize=4)
+def _read_vehicle(input_deck):
+    return create_vehicle(input_deck)
+
+
+def _create_vehicle(input_deck):
+    # parsed decks are shared between tests, return copies so they are free to modify
+    # their inputs
+    return deepcopy(_read_vehicle(input_deck))
+
+
 @unittest.skipUnless(importlib.util.find_spec("pyoptsparse") is not None, "pyoptsparse is not installed")
 class IdleDescentTestCase(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # vehicle, engine deck, and subsystems are identical for every test, so only
+        # build them once
         input_deck = 'models/large_single_aisle_1/large_single_aisle_1_GwGm.csv'
-        aviary_inputs, _ = create_vehicle(input_deck)
+        aviary_inputs, _ = _create_vehicle(input_deck)
         aviary_inputs.set_val(Settings.VERBOSITY, Verbosity.QUIET)
         aviary_inputs.set_val(Aircraft.Engine.SCALED_SLS_THRUST, val=28690, units="lbf")
         aviary_inputs.set_val(Dynamic.Mission.THROTTLE, val=0, units="unitless")
@@ -30,18 +44,17 @@ class IdleDescentTestCase(unittest.TestCase):
         engine = build_engine_deck(aviary_options=aviary_inputs)
         preprocess_propulsion(aviary_inputs, engine)
 
-        default_mission_subsystems = get_default_mission_subsystems(
-            'GASP', build_engine_deck(aviary_inputs))
+        default_mission_subsystems = get_default_mission_subsystems('GASP', engine)
 
         ode_args = dict(aviary_options=aviary_inputs,
                         core_subsystems=default_mission_subsystems)
 
-        self.ode_args = ode_args
-        self.aviary_inputs = aviary_inputs
-        self.tol = 1e-5
+        cls.ode_args = ode_args
+        cls.aviary_inputs = aviary_inputs
+        cls.tol = 1e-5
 
-        add_default_sgm_args(descent_phases, self.ode_args)
-        self.phases = descent_phases
+        add_default_sgm_args(descent_phases, cls.ode_args)
+        cls.phases = descent_phases
 
     def test_case1(self):
 
@@ -68,7 +81,7 @@ class IdleDescentTestCase(unittest.TestCase):
             reserve_fuel=4500,
         )
 
-        prob.setup()
+        prob.setup(check=False, mode='fwd', force_alloc_complex=False)
 
         warnings.filterwarnings('ignore', category=UserWarning)
         prob.run_model()
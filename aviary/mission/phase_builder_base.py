@@ -70,6 +70,10 @@ class PhaseBuilderBase(ABC):
         class attribute: derived type customization point; the default value
         for num_nodes used by build_phase, only for AnalyticPhases
 
+    default_initial_guesses : tuple (())
+        class attribute: derived type customization point; (InitialGuess, desc) pairs
+        registered as supported initial guesses when the derived type is defined
+
     Methods
     -------
     build_phase
@@ -93,8 +97,20 @@ class PhaseBuilderBase(ABC):
     default_ode_class = MissionODE
 
     default_meta_data = _MetaData
+
+    default_initial_guesses = ()
     # endregion : derived type customization points
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # only register guesses declared directly on this class; inherited ones are
+        # already in the (possibly shared) meta data of the base class
+        initial_guesses = cls.__dict__.get('default_initial_guesses', ())
+
+        for initial_guess, desc in initial_guesses:
+            cls._add_initial_guess_meta_data(initial_guess, desc=desc)
+
     def __init__(
         self, name=None, core_subsystems=None, user_options=None, initial_guesses=None,
         ode_class=None, transcription=None, subsystem_options=None, is_analytic_phase=False, num_nodes=5, external_subsystems=None, meta_data=None,
@@ -247,15 +263,8 @@ class PhaseBuilderBase(ABC):
         if user_options is None:
             user_options = self.user_options = AviaryValues()
 
-        meta_data = self._meta_data_
-
-        for key in meta_data:
+        for key, val, units in self._get_default_options():
             if key not in user_options:
-                item = meta_data[key]
-
-                val = item['val']
-                units = item['units']
-
                 user_options.set_val(key, val, units)
 
     def validate_initial_guesses(self):
@@ -398,6 +407,31 @@ class PhaseBuilderBase(ABC):
 
         meta_data[name] = dict(val=val, units=units, desc=desc)
 
+    @classmethod
+    def _get_default_options(cls):
+        '''
+        Return a tuple of (name, val, units) for every supported option.
+
+        The tuple is built once per class from the supported options meta data and
+        reused by assign_default_options for every new instance.
+        '''
+        meta_data = cls._meta_data_
+        cached = cls.__dict__.get('_default_options_')
+
+        # options can only be added, never replaced, so a size mismatch is enough to
+        # detect a stale cache
+        if (
+            cached is None or cached[0] is not meta_data
+            or len(cached[1]) != len(meta_data)
+        ):
+            defaults = tuple(
+                (key, meta_data[key]['val'], meta_data[key]['units'])
+                for key in meta_data)
+
+            cached = cls._default_options_ = (meta_data, defaults)
+
+        return cached[1]
+
     @classmethod
     def _add_initial_guess_meta_data(cls, initial_guess: InitialGuess, desc=None):
         '''
@@ -415,6 +449,10 @@ class PhaseBuilderBase(ABC):
             apply_initial_guess=initial_guess.apply_initial_guess, desc=desc)
 
     def _add_user_defined_constraints(self, phase, constraints):
+        # most phases have no user defined constraints
+        if not constraints:
+            return
+
         # Add each constraint and its corresponding arguments to the phase
         for constraint_name, kwargs in constraints.items():
             if kwargs['type'] == 'boundary':
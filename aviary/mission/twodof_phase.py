@@ -4,6 +4,7 @@ from aviary.mission.flight_phase_builder import FlightPhaseBase, register
 from aviary.mission.initial_guess_builders import InitialGuessState, InitialGuessIntegrationVariable, InitialGuessControl, InitialGuessPolynomialControl
 
 from aviary.utils.aviary_values import AviaryValues
+from aviary.mission.flops_based.phases.phase_utils import get_lgl_segment_ends
 from aviary.variable_info.variable_meta_data import _MetaData
 from aviary.variable_info.variables import Dynamic
 from aviary.mission.gasp_based.ode.unsteady_solved.unsteady_solved_ode import UnsteadySolvedODE
@@ -92,7 +93,7 @@ class TwoDOFPhase(FlightPhaseBase):
         num_segments, _ = user_options.get_item('num_segments')
         order, _ = user_options.get_item('order')
 
-        seg_ends, _ = dm.utils.lgl.lgl(num_segments + 1)
+        seg_ends = get_lgl_segment_ends(num_segments)
 
         transcription = dm.Radau(
             num_segments=num_segments, order=order, compressed=True,
@@ -6,7 +6,7 @@ TODO: blended-wing-body support
 TODO: multiple engine model support
 '''
 import openmdao.api as om
-from numpy import pi
+from numpy import pi, sqrt
 
 from aviary.subsystems.geometry.flops_based.canard import Canard
 from aviary.subsystems.geometry.flops_based.characteristic_lengths import \
@@ -33,84 +33,111 @@ class PrepGeom(om.Group):
             'aviary_options', types=AviaryValues,
             desc='collection of Aircraft/Mission specific options')
 
+        self.options.declare(
+            'active_subsystems', default=None, types=(set, type(None)),
+            desc='names of the subsystems to include, from fuselage_prelim, '
+            'wing_prelim, prelim, wing, tail, fuselage, nacelles, canard, '
+            'characteristic_lengths, and total_wetted_area; all are included by '
+            'default. Aircraft outputs of excluded subsystems must be provided by '
+            'the surrounding model. The internal values computed by prelim (see '
+            'Names) are not promoted, so if prelim is excluded they must be connected '
+            "directly to the subsystems that use them, e.g. to "
+            "'prep_geom.wing.' + Names.CROOT")
+
     def setup(self):
         aviary_options = self.options['aviary_options']
 
-        self.add_subsystem(
-            'fuselage_prelim', FuselagePrelim(aviary_options=aviary_options),
-            promotes_inputs=['*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('fuselage_prelim'):
+            self.add_subsystem(
+                'fuselage_prelim', FuselagePrelim(aviary_options=aviary_options),
+                promotes_inputs=['*'],
+                promotes_outputs=['*']
+            )
 
-        self.add_subsystem(
-            'wing_prelim', WingPrelim(aviary_options=aviary_options),
-            promotes_inputs=['*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('wing_prelim'):
+            self.add_subsystem(
+                'wing_prelim', WingPrelim(aviary_options=aviary_options),
+                promotes_inputs=['*'],
+                promotes_outputs=['*']
+            )
 
-        self.add_subsystem(
-            'prelim', _Prelim(aviary_options=aviary_options),
-            promotes_inputs=['*'],
-        )
+        if self._is_active('prelim'):
+            self.add_subsystem(
+                'prelim', _Prelim(aviary_options=aviary_options),
+                promotes_inputs=['*'],
+            )
 
-        self.add_subsystem(
-            'wing', _Wing(aviary_options=aviary_options),
-            promotes_inputs=['aircraft*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('wing'):
+            self.add_subsystem(
+                'wing', _Wing(aviary_options=aviary_options),
+                promotes_inputs=['aircraft*'],
+                promotes_outputs=['*']
+            )
 
-        self.connect(f'prelim.{Names.CROOT}', f'wing.{Names.CROOT}')
-        self.connect(f'prelim.{Names.CROOTB}', f'wing.{Names.CROOTB}')
-        self.connect(f'prelim.{Names.XDX}', f'wing.{Names.XDX}')
-        self.connect(f'prelim.{Names.XMULT}', f'wing.{Names.XMULT}')
+            self._connect_prelim(
+                'wing', Names.CROOT, Names.CROOTB, Names.XDX, Names.XMULT)
 
-        self.add_subsystem(
-            'tail', _Tail(aviary_options=aviary_options),
-            promotes_inputs=['aircraft*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('tail'):
+            self.add_subsystem(
+                'tail', _Tail(aviary_options=aviary_options),
+                promotes_inputs=['aircraft*'],
+                promotes_outputs=['*']
+            )
 
-        self.connect(f'prelim.{Names.XMULTH}', f'tail.{Names.XMULTH}')
-        self.connect(f'prelim.{Names.XMULTV}', f'tail.{Names.XMULTV}')
+            self._connect_prelim('tail', Names.XMULTH, Names.XMULTV)
 
-        self.add_subsystem(
-            'fuselage', _Fuselage(aviary_options=aviary_options),
-            promotes_inputs=['aircraft*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('fuselage'):
+            self.add_subsystem(
+                'fuselage', _Fuselage(aviary_options=aviary_options),
+                promotes_inputs=['aircraft*'],
+                promotes_outputs=['*']
+            )
 
-        self.connect(f'prelim.{Names.CROOTB}', f'fuselage.{Names.CROOTB}')
-        self.connect(f'prelim.{Names.CROTVT}', f'fuselage.{Names.CROTVT}')
-        self.connect(f'prelim.{Names.CRTHTB}', f'fuselage.{Names.CRTHTB}')
+            self._connect_prelim(
+                'fuselage', Names.CROOTB, Names.CROTVT, Names.CRTHTB)
 
-        self.add_subsystem(
-            'nacelles', Nacelles(aviary_options=aviary_options),
-            promotes_inputs=['aircraft*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('nacelles'):
+            self.add_subsystem(
+                'nacelles', Nacelles(aviary_options=aviary_options),
+                promotes_inputs=['aircraft*'],
+                promotes_outputs=['*']
+            )
 
-        self.add_subsystem(
-            'canard', Canard(aviary_options=aviary_options),
-            promotes_inputs=['aircraft*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('canard'):
+            self.add_subsystem(
+                'canard', Canard(aviary_options=aviary_options),
+                promotes_inputs=['aircraft*'],
+                promotes_outputs=['*']
+            )
 
-        self.add_subsystem(
-            'characteristic_lengths',
-            CharacteristicLengths(aviary_options=aviary_options),
-            promotes_inputs=['aircraft*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('characteristic_lengths'):
+            self.add_subsystem(
+                'characteristic_lengths',
+                CharacteristicLengths(aviary_options=aviary_options),
+                promotes_inputs=['aircraft*'],
+                promotes_outputs=['*']
+            )
 
-        self.connect(
-            f'prelim.{Names.CROOT}', f'characteristic_lengths.{Names.CROOT}'
-        )
+            self._connect_prelim('characteristic_lengths', Names.CROOT)
 
-        self.add_subsystem(
-            'total_wetted_area', TotalWettedArea(aviary_options=aviary_options),
-            promotes_inputs=['*'],
-            promotes_outputs=['*']
-        )
+        if self._is_active('total_wetted_area'):
+            self.add_subsystem(
+                'total_wetted_area', TotalWettedArea(aviary_options=aviary_options),
+                promotes_inputs=['*'],
+                promotes_outputs=['*']
+            )
+
+    def _is_active(self, name):
+        active_subsystems = self.options['active_subsystems']
+
+        return active_subsystems is None or name in active_subsystems
+
+    def _connect_prelim(self, subsystem, *names):
+        # internal derived values are only connected when prelim is included; otherwise
+        # the surrounding model is responsible for providing them
+        if self._is_active('prelim'):
+            for name in names:
+                self.connect(f'prelim.{name}', f'{subsystem}.{name}')
 
 
 class _Prelim(om.ExplicitComponent):
@@ -259,7 +286,7 @@ class _Prelim(om.ExplicitComponent):
         aspect_ratio = inputs[Aircraft.HorizontalTail.ASPECT_RATIO]
         area = inputs[Aircraft.HorizontalTail.AREA]
 
-        span = outputs[Names.SPANHT] = (aspect_ratio * area)**0.5
+        span = outputs[Names.SPANHT] = sqrt(aspect_ratio * area)
 
         CRTHTB = 0.0
 
@@ -292,7 +319,7 @@ class _Prelim(om.ExplicitComponent):
         area = inputs[Aircraft.VerticalTail.AREA]
         aspect_ratio = inputs[Aircraft.VerticalTail.ASPECT_RATIO]
 
-        span = outputs[Names.SPANVT] = (area * aspect_ratio)**0.5
+        span = outputs[Names.SPANVT] = sqrt(area * aspect_ratio)
 
         CROTVT = 0.0
 
@@ -311,7 +338,7 @@ class _Prelim(om.ExplicitComponent):
         aspect_ratio = inputs[Aircraft.HorizontalTail.ASPECT_RATIO]
 
         span2 = area * aspect_ratio
-        span = span2**0.5
+        span = sqrt(span2)
         f = 0.5 / span
 
         J[Names.SPANHT, Aircraft.HorizontalTail.AREA] = f * aspect_ratio
@@ -338,7 +365,7 @@ class _Prelim(om.ExplicitComponent):
             #      df0 * g0 - f0 * dg0   df1 * g1 - f1 * dg1
             #    = ___________________ + ___________________
             #             g0**2                 g1**2
-            dspan_darea = 0.5 * (aspect_ratio / area) ** 0.5
+            dspan_darea = 0.5 * sqrt(aspect_ratio / area)
 
             da = (
                 2.0 / _1p_tr * (1.0 - area * dspan_darea / span) / span
@@ -437,7 +464,7 @@ class _Prelim(om.ExplicitComponent):
         area = inputs[Aircraft.VerticalTail.AREA]
         aspect_ratio = inputs[Aircraft.VerticalTail.ASPECT_RATIO]
 
-        span = (area * aspect_ratio)**0.5
+        span = sqrt(area * aspect_ratio)
 
         J[Names.SPANVT, Aircraft.VerticalTail.AREA] = \
             0.5 * aspect_ratio / span
@@ -752,6 +779,10 @@ class _Fuselage(om.ExplicitComponent):
         add_aviary_output(self, Aircraft.Fuselage.LENGTH_TO_DIAMETER, 0.0)
         add_aviary_output(self, Aircraft.Fuselage.WETTED_AREA, 0.0)
 
+        # inputs and results of the last evaluation of the fuselage ratios
+        self._ratios = (None, None)
+        self._ratio_partials = (None, None)
+
     def setup_partials(self):
         self.declare_partials(
             Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
@@ -798,13 +829,10 @@ class _Fuselage(om.ExplicitComponent):
         aviary_options: AviaryValues = self.options['aviary_options']
         num_fuselages = aviary_options.get_val(Aircraft.Fuselage.NUM_FUSELAGES)
 
-        area = inputs[Aircraft.Wing.AREA]
-        aspect_ratio = inputs[Aircraft.Wing.ASPECT_RATIO]
         avg_diam = inputs[Aircraft.Fuselage.AVG_DIAMETER]
-        glove_and_bat = inputs[Aircraft.Wing.GLOVE_AND_BAT]
+        length = inputs[Aircraft.Fuselage.LENGTH]
 
-        diam_to_wing_span = \
-            avg_diam / (aspect_ratio * (area - glove_and_bat))**0.5
+        diam_to_wing_span, length_to_diam = self._fuselage_ratios(inputs)
 
         outputs[Aircraft.Fuselage.DIAMETER_TO_WING_SPAN] = diam_to_wing_span
 
@@ -812,19 +840,12 @@ class _Fuselage(om.ExplicitComponent):
 
         outputs[Aircraft.Fuselage.CROSS_SECTION] = cross_section
 
-        length_to_diam = 100.0  # FLOPS default value
-
-        if 0.0 < avg_diam:
-            length = inputs[Aircraft.Fuselage.LENGTH]
-
-            length_to_diam = length / avg_diam
-
         outputs[Aircraft.Fuselage.LENGTH_TO_DIAMETER] = length_to_diam
 
         wetted_area = 0.0
         scaler = inputs[Aircraft.Fuselage.WETTED_AREA_SCALER]
 
-        if (0 < num_fuselages) and (0.0 < avg_diam):
+        if (0 < num_fuselages) and _is_positive(avg_diam):
             CROOTB = inputs[Names.CROOTB]
             thickness_chord = inputs[Aircraft.Wing.THICKNESS_TO_CHORD]
 
@@ -857,56 +878,18 @@ class _Fuselage(om.ExplicitComponent):
         aviary_options: AviaryValues = self.options['aviary_options']
         num_fuselages = aviary_options.get_val(Aircraft.Fuselage.NUM_FUSELAGES)
 
-        area = inputs[Aircraft.Wing.AREA]
-        aspect_ratio = inputs[Aircraft.Wing.ASPECT_RATIO]
         avg_diam = inputs[Aircraft.Fuselage.AVG_DIAMETER]
-        glove_and_bat = inputs[Aircraft.Wing.GLOVE_AND_BAT]
-
-        fact = aspect_ratio * (area - glove_and_bat)
-        fact2 = 1.0 / fact ** 1.5
-
-        J[
-            Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
-            Aircraft.Fuselage.AVG_DIAMETER
-        ] = 1.0 / fact ** 0.5
-
-        J[
-            Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
-            Aircraft.Wing.ASPECT_RATIO
-        ] = -0.5 * avg_diam * (area - glove_and_bat) * fact2
+        length = inputs[Aircraft.Fuselage.LENGTH]
 
-        J[Aircraft.Fuselage.DIAMETER_TO_WING_SPAN, Aircraft.Wing.AREA] = \
-            -0.5 * avg_diam * aspect_ratio * fact2
-
-        J[
-            Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
-            Aircraft.Wing.GLOVE_AND_BAT
-        ] = 0.5 * avg_diam * aspect_ratio * fact2
+        for wrt, val in zip(
+            _fuselage_ratio_partials_wrt, self._fuselage_ratio_partials(inputs)
+        ):
+            J[wrt] = val
 
         J[Aircraft.Fuselage.CROSS_SECTION, Aircraft.Fuselage.AVG_DIAMETER] = \
             0.5 * pi * avg_diam
 
-        if 0.0 < avg_diam:
-            length = inputs[Aircraft.Fuselage.LENGTH]
-
-            J[
-                Aircraft.Fuselage.LENGTH_TO_DIAMETER,
-                Aircraft.Fuselage.AVG_DIAMETER
-            ] = -length / avg_diam ** 2
-
-            J[
-                Aircraft.Fuselage.LENGTH_TO_DIAMETER, Aircraft.Fuselage.LENGTH
-            ] = 1.0 / avg_diam
-
-        else:
-            J[
-                Aircraft.Fuselage.LENGTH_TO_DIAMETER,
-                Aircraft.Fuselage.AVG_DIAMETER
-            ] = J[
-                Aircraft.Fuselage.LENGTH_TO_DIAMETER, Aircraft.Fuselage.LENGTH
-            ] = 0.0
-
-        if (0 < num_fuselages) and (0.0 < avg_diam):
+        if (0 < num_fuselages) and _is_positive(avg_diam):
             CROOTB = inputs[Names.CROOTB]
             CRTHTB = inputs[Names.CRTHTB]
             CROTVT = inputs[Names.CROTVT]
@@ -1002,3 +985,123 @@ class _Fuselage(om.ExplicitComponent):
             ] = J[
                 Aircraft.Fuselage.WETTED_AREA, Aircraft.Wing.THICKNESS_TO_CHORD
             ] = 0.0
+
+    def _fuselage_ratios(self, inputs):
+        '''
+        Return the fuselage diameter to wing span and length to diameter ratios.
+
+        These only depend on design parameters, which rarely change between
+        evaluations, so the results are reused while the inputs are unchanged.
+        '''
+        key = _fuselage_ratios_key(inputs)
+        last_key, ratios = self._ratios
+
+        if key == last_key:
+            return ratios
+
+        area = inputs[Aircraft.Wing.AREA]
+        aspect_ratio = inputs[Aircraft.Wing.ASPECT_RATIO]
+        avg_diam = inputs[Aircraft.Fuselage.AVG_DIAMETER]
+        glove_and_bat = inputs[Aircraft.Wing.GLOVE_AND_BAT]
+
+        inv_sqrt_fact, _ = _wing_span_factors(area, aspect_ratio, glove_and_bat)
+
+        diam_to_wing_span = avg_diam * inv_sqrt_fact
+
+        length_to_diam = 100.0  # FLOPS default value
+
+        if _is_positive(avg_diam):
+            length = inputs[Aircraft.Fuselage.LENGTH]
+
+            length_to_diam = length / avg_diam
+
+        ratios = (diam_to_wing_span, length_to_diam)
+        self._ratios = (key, ratios)
+
+        return ratios
+
+    def _fuselage_ratio_partials(self, inputs):
+        '''
+        Return the partials of the fuselage ratios, in the order of
+        _fuselage_ratio_partials_wrt.
+
+        The results are reused while the inputs are unchanged.
+        '''
+        key = _fuselage_ratios_key(inputs)
+        last_key, partials = self._ratio_partials
+
+        if key == last_key:
+            return partials
+
+        area = inputs[Aircraft.Wing.AREA]
+        aspect_ratio = inputs[Aircraft.Wing.ASPECT_RATIO]
+        avg_diam = inputs[Aircraft.Fuselage.AVG_DIAMETER]
+        glove_and_bat = inputs[Aircraft.Wing.GLOVE_AND_BAT]
+
+        inv_sqrt_fact, fact2 = \
+            _wing_span_factors(area, aspect_ratio, glove_and_bat)
+
+        dlength_to_diam_davg_diam = dlength_to_diam_dlength = 0.0
+
+        if _is_positive(avg_diam):
+            length = inputs[Aircraft.Fuselage.LENGTH]
+
+            inv_diam = 1.0 / avg_diam
+
+            dlength_to_diam_davg_diam = -length * inv_diam * inv_diam
+            dlength_to_diam_dlength = inv_diam
+
+        partials = (
+            inv_sqrt_fact,
+            -0.5 * avg_diam * (area - glove_and_bat) * fact2,
+            -0.5 * avg_diam * aspect_ratio * fact2,
+            0.5 * avg_diam * aspect_ratio * fact2,
+            dlength_to_diam_davg_diam,
+            dlength_to_diam_dlength,
+        )
+
+        self._ratio_partials = (key, partials)
+
+        return partials
+
+
+# inputs that the fuselage ratios depend on
+_fuselage_ratio_inputs = (
+    Aircraft.Wing.AREA,
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Fuselage.AVG_DIAMETER,
+    Aircraft.Wing.GLOVE_AND_BAT,
+    Aircraft.Fuselage.LENGTH,
+)
+
+# (of, wrt) pairs of the partials returned by _Fuselage._fuselage_ratio_partials()
+_fuselage_ratio_partials_wrt = (
+    (Aircraft.Fuselage.DIAMETER_TO_WING_SPAN, Aircraft.Fuselage.AVG_DIAMETER),
+    (Aircraft.Fuselage.DIAMETER_TO_WING_SPAN, Aircraft.Wing.ASPECT_RATIO),
+    (Aircraft.Fuselage.DIAMETER_TO_WING_SPAN, Aircraft.Wing.AREA),
+    (Aircraft.Fuselage.DIAMETER_TO_WING_SPAN, Aircraft.Wing.GLOVE_AND_BAT),
+    (Aircraft.Fuselage.LENGTH_TO_DIAMETER, Aircraft.Fuselage.AVG_DIAMETER),
+    (Aircraft.Fuselage.LENGTH_TO_DIAMETER, Aircraft.Fuselage.LENGTH),
+)
+
+
+def _fuselage_ratios_key(inputs):
+    # input values compare exactly, including any complex step perturbation
+    return tuple(inputs[name].item() for name in _fuselage_ratio_inputs)
+
+
+def _wing_span_factors(area, aspect_ratio, glove_and_bat):
+    '''
+    Return 1 / sqrt(fact) and 1 / fact**1.5, where fact = aspect_ratio * (area -
+    glove_and_bat) is the square of the wing span.
+    '''
+    fact = aspect_ratio * (area - glove_and_bat)
+    inv_sqrt_fact = 1.0 / sqrt(fact)
+
+    return inv_sqrt_fact, inv_sqrt_fact / fact
+
+
+def _is_positive(value):
+    # compare a single element input as a python scalar instead of through the truth
+    # value of an array; under complex step only the real part is compared
+    return 0.0 < value.real.item()
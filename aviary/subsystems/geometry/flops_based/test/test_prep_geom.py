@@ -1,7 +1,7 @@
 import unittest
 
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_check_partials
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from parameterized import parameterized
 
 from aviary.subsystems.geometry.flops_based.canard import Canard
@@ -191,6 +191,79 @@ class PrepGeomTest(unittest.TestCase):
         partial_data = prob.check_partials(out_stream=None, method="cs")
         assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
 
+    def test_active_subsystems(self):
+        options = get_flops_inputs('LargeSingleAisle1FLOPS', preprocess=True)
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem(
+            'prep_geom',
+            PrepGeom(aviary_options=options,
+                     active_subsystems={'fuselage_prelim', 'prelim', 'fuselage'}),
+            promotes=['*'])
+
+        prob.setup(check=False)
+
+        subsystems = [
+            system.name for system in prob.model.prep_geom.system_iter(recurse=False)]
+
+        self.assertEqual(subsystems, ['fuselage_prelim', 'prelim', 'fuselage'])
+
+    def test_active_subsystems_provided_values(self):
+        options = get_flops_inputs('LargeSingleAisle1FLOPS', preprocess=True)
+        prelim_names = [Names.CROOTB, Names.CROTVT, Names.CRTHTB]
+        outputs = [Aircraft.Fuselage.CROSS_SECTION,
+                   Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
+                   Aircraft.Fuselage.LENGTH_TO_DIAMETER,
+                   Aircraft.Fuselage.WETTED_AREA]
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem(
+            'prep_geom',
+            PrepGeom(aviary_options=options,
+                     active_subsystems={'fuselage_prelim', 'prelim', 'fuselage'}),
+            promotes=['*'])
+
+        prob.setup(check=False)
+        self._set_flops_inputs(prob, options)
+        prob.run_model()
+
+        prelim_values = {
+            name: prob.get_val('prelim.' + name) for name in prelim_names}
+        expected = {name: prob.get_val(name) for name in outputs}
+
+        # without prelim, its internal values are not promoted and must be connected
+        # directly to the subsystems that use them
+        prob = om.Problem()
+
+        ivc = prob.model.add_subsystem('prelim_values', om.IndepVarComp())
+
+        for name in prelim_names:
+            ivc.add_output(name, prelim_values[name], units='unitless')
+            prob.model.connect('prelim_values.' + name, 'fuselage.' + name)
+
+        prob.model.add_subsystem(
+            'prep_geom',
+            PrepGeom(aviary_options=options,
+                     active_subsystems={'fuselage_prelim', 'fuselage'}),
+            promotes=['*'])
+
+        prob.setup(check=False)
+        self._set_flops_inputs(prob, options)
+        prob.run_model()
+
+        for name in outputs:
+            assert_near_equal(prob.get_val(name), expected[name], tolerance=1e-12)
+
+    def _set_flops_inputs(self, prob, options):
+        inputs = prob.model.get_io_metadata(iotypes='input')
+
+        for prom_name in {meta['prom_name'] for meta in inputs.values()}:
+            if prom_name in options:
+                val, units = options.get_item(prom_name)
+                prob.set_val(prom_name, val, units)
+
 
 class _PrelimTest(unittest.TestCase):
 
@@ -384,6 +457,40 @@ class _FuselageTest(unittest.TestCase):
                            atol=1e-6,
                            rtol=1e-4)
 
+    def test_changed_inputs(self):
+        prob = self.prob
+
+        options = AviaryValues()
+        options.set_val(Aircraft.Fuselage.NUM_FUSELAGES, 1)
+
+        prob.model.add_subsystem('fuse', _Fuselage(aviary_options=options),
+                                 promotes=['*'])
+
+        prob.setup(check=False)
+
+        prob.set_val(Aircraft.Fuselage.AVG_DIAMETER, 12.0, 'ft')
+        prob.set_val(Aircraft.Fuselage.LENGTH, 120.0, 'ft')
+        prob.set_val(Aircraft.Wing.AREA, 1000.0, 'ft**2')
+        prob.set_val(Aircraft.Wing.ASPECT_RATIO, 10.0)
+
+        prob.run_model()
+
+        assert_near_equal(
+            prob.get_val(Aircraft.Fuselage.DIAMETER_TO_WING_SPAN), 0.12, 1e-12)
+        assert_near_equal(
+            prob.get_val(Aircraft.Fuselage.LENGTH_TO_DIAMETER), 10.0, 1e-12)
+
+        # results of a previous evaluation must not be reused for new inputs
+        prob.set_val(Aircraft.Wing.AREA, 1600.0, 'ft**2')
+        prob.set_val(Aircraft.Fuselage.LENGTH, 144.0, 'ft')
+
+        prob.run_model()
+
+        assert_near_equal(
+            prob.get_val(Aircraft.Fuselage.DIAMETER_TO_WING_SPAN), 0.0948683298, 1e-9)
+        assert_near_equal(
+            prob.get_val(Aircraft.Fuselage.LENGTH_TO_DIAMETER), 12.0, 1e-12)
+
     def test_IO(self):
         assert_match_varnames(self.prob.model)
 
@@ -36,7 +36,7 @@ from aviary.subsystems.propulsion.engine_sizing import SizeEngine
 from aviary.subsystems.propulsion.utils import (EngineModelVariables,
                                                 convert_geopotential_altitude,
                                                 default_units)
-from aviary.utils.aviary_values import AviaryValues, NamedValues, get_keys, get_items
+from aviary.utils.aviary_values import AviaryValues, NamedValues, get_keys
 from aviary.variable_info.variable_meta_data import _MetaData
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission, Settings
 from aviary.utils.csv_data_file import read_data_file
@@ -79,6 +79,11 @@ aliases = {
     TAILPIPE_THRUST: ['tailpipe_thrust'],
 }
 
+# "reverse" lookup of aliases, mapping each alias to the enum it points to
+_reverse_aliases = {
+    name: key for key, names in aliases.items() for name in names
+}
+
 # these variables must be present in engine performance data
 default_required_variables = {
     MACH,
@@ -107,6 +112,13 @@ dependent_options = {
                                            Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION,)
 }
 
+# (default value, units) from metadata for each option EngineDecks may need to fill in
+_option_defaults = {
+    key: (_MetaData[key]['default_value'], _MetaData[key]['units'])
+    for key in (Aircraft.Engine.DATA_FILE,) + required_options
+    + sum(dependent_options.values(), ())
+}
+
 
 class EngineDeck(EngineModel):
     """
@@ -175,6 +187,8 @@ class EngineDeck(EngineModel):
 
         # Create dict for variables present in engine data with associated units
         self.engine_variables = {}
+        # units for all engine variables, built when first needed by build_mission()
+        self.engine_variable_units = None
 
         # TODO make this an option - disabling global throttle ranges is better to
         #      prevent unintended extrapolation, but breaks missions using GASP-based
@@ -206,6 +220,7 @@ class EngineDeck(EngineModel):
         super()._preprocess_inputs()
 
         options = self.options
+        verbosity = self.get_val(Settings.VERBOSITY).value
 
         # CHECK FOR REQUIRED OPTIONS
         additional_options = ()
@@ -214,10 +229,9 @@ class EngineDeck(EngineModel):
 
         for key in additional_options + required_options:
             if key not in options:
-                val = _MetaData[key]['default_value']
-                units = _MetaData[key]['units']
+                val, units = _option_defaults[key]
 
-                if self.get_val(Settings.VERBOSITY).value >= 1:
+                if verbosity >= 1:
                     warnings.warn(
                         f'<{key}> is a required option for EngineDecks, but has not been '
                         f'specified for EngineDeck <{self.name}>. The default value '
@@ -230,8 +244,7 @@ class EngineDeck(EngineModel):
             if self.get_val(key):
                 for item in dependent_options[key]:
                     if item not in options:
-                        val = _MetaData[item]['default_value']
-                        units = _MetaData[item]['units']
+                        val, units = _option_defaults[item]
                         self.set_val(item, val, units)
 
         # LOGIC CHECKS
@@ -241,7 +254,7 @@ class EngineDeck(EngineModel):
             # Allowing idle fractions to be equal, i.e. fixing flight idle conditions
             # instead of extrapolation
             if idle_min > idle_max:
-                if self.get_val(Settings.VERBOSITY).value >= 1:
+                if verbosity >= 1:
                     warnings.warn(
                         f'EngineDeck <{self.name}>: Minimum flight idle fraction exceeds maximum '
                         f'flight idle fraction. Values for min and max fraction will be flipped.'
@@ -267,7 +280,7 @@ class EngineDeck(EngineModel):
             thrust_provided = True
 
         # user provided target thrust or scale factor, but performance scaling is off
-        if scale_performance and (scale_factor_provided or thrust_provided) and self.get_val(Settings.VERBOSITY).value >= 1:
+        if scale_performance and (scale_factor_provided or thrust_provided) and verbosity >= 1:
             warnings.warn(
                 f'EngineDeck <{self.name}>: Scaling targets are provided, but will be '
                 'ignored because performance scaling is disabled. Set '
@@ -348,6 +361,8 @@ class EngineDeck(EngineModel):
         ValueError
             If non-numerical data found in DATA_FILE (not including header or comments).
         """
+        verbosity = self.get_val(Settings.VERBOSITY).value
+
         # custom error messages depending on data type
         if self.read_from_file:
             message = f'<{self.get_val(Aircraft.Engine.DATA_FILE)}>'
@@ -365,15 +380,9 @@ class EngineDeck(EngineModel):
             # run provided data through aliases
             # create dict of what names to change, modify outside of loop
             alias_dict = {}
-            for item in get_items(raw_data):
-                var = item[0]
-                val = item[1][0]
-                units = item[1][1]
-                # quick "reverse" lookup of aliases
-                for key in aliases:
-                    if var in aliases[key]:
-                        alias_dict[var] = key
-                        break
+            for var in get_keys(raw_data):
+                if var in _reverse_aliases:
+                    alias_dict[var] = _reverse_aliases[var]
 
             # replace old names with aliased ones
             for name in alias_dict:
@@ -389,8 +398,9 @@ class EngineDeck(EngineModel):
                 # Convert data to expected units. Required so settings like tolerances
                 # that assume units work as expected
                 try:
-                    val = np.array([convert_units(i, units, default_units[key])
-                                   for i in val])
+                    # convert the whole column at once, on a copy of the provided data
+                    val = convert_units(np.array(val, dtype=float), units,
+                                        default_units[key])
                 except TypeError:
                     raise TypeError(f"{message}: units of '{units}' provided for "
                                     f'<{key.name}> are not compatible with expected units '
@@ -401,7 +411,7 @@ class EngineDeck(EngineModel):
                 self.engine_variables[key] = default_units[key]
 
             else:
-                if self.get_val(Settings.VERBOSITY).value >= 1:
+                if verbosity >= 1:
                     warnings.warn(
                         f'{message}: header <{key}> was not recognized, and will be skipped')
 
@@ -435,6 +445,8 @@ class EngineDeck(EngineModel):
         UserWarning
             If required variables are not present in the provided engine data.
         """
+        verbosity = self.get_val(Settings.VERBOSITY).value
+
         # custom error messages depending on data type
         if self.read_from_file:
             message = f'<{self.get_val(Aircraft.Engine.DATA_FILE)}>'
@@ -470,8 +482,8 @@ class EngineDeck(EngineModel):
                 - self._original_data[RAM_DRAG]
             # prefer using directly provided values for net thrust vs. calculating
             if THRUST in engine_variables:
-                res = abs(net_thrust_calc - self._original_data[THRUST])
-                if np.any(self.thrust_tol > res):
+                if not np.allclose(net_thrust_calc, self._original_data[THRUST],
+                                   rtol=0, atol=self.thrust_tol):
                     raise UserWarning('Provided net thrust is not equal to difference '
                                       '(within tolerance) between gross thrust and ram '
                                       f'drag in {message}')
@@ -500,7 +512,7 @@ class EngineDeck(EngineModel):
         # them for consistency, as that requires information not avaliable here
         # (freestream air temp and pressure). Instead, we must trust the source and
         # assume either data set is valid and can be used.
-        if SHAFT_POWER in engine_variables and SHAFT_POWER_CORRECTED in engine_variables and self.get_val(Settings.VERBOSITY).value >= 1:
+        if SHAFT_POWER in engine_variables and SHAFT_POWER_CORRECTED in engine_variables and verbosity >= 1:
             warnings.warn('Both corrected and uncorrected shaft horsepower are '
                           f'present in {message}. The two cannot be validated for '
                           'consistency, and either variable could be utilized if '
@@ -532,9 +544,11 @@ class EngineDeck(EngineModel):
 
         # removes data points with negative thrust if requested
         if self.get_val(Aircraft.Engine.IGNORE_NEGATIVE_THRUST):
-            keep_idx = np.where(model[THRUST] >= 0)
+            keep = model[THRUST] >= 0
             for key in model:
-                model[key] = model[key][keep_idx]
+                model[key] = model[key][keep]
+
+            self.model_length = len(model[ALTITUDE])
 
     def _generate_flight_idle(self):
         """
@@ -545,32 +559,6 @@ class EngineDeck(EngineModel):
 
         Modifies unpacked data in place, updates packed data.
         """
-        def _extrapolate(array):
-            """
-            Linearly extrapolate variable to idle thrust point.
-
-            Parameters
-            ----------
-            array : numpy.ndarray
-                Data used for extrapolation.
-
-            Returns
-            -------
-            rvalue : float
-                Extrapolated flight idle value.
-            """
-            y0 = array[0]
-            y1 = array[1]
-
-            if y0 == 0 and y1 == 0:
-                return 0
-
-            rvalue = (
-                y0 + (y1 - y0) * extrap_term
-            )
-
-            return rvalue
-
         idle_thrust_fract = self.get_val(Aircraft.Engine.FLIGHT_IDLE_THRUST_FRACTION)
         idle_min_fract = self.get_val(Aircraft.Engine.FLIGHT_IDLE_MIN_FRACTION)
         idle_max_fract = self.get_val(Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION)
@@ -586,9 +574,9 @@ class EngineDeck(EngineModel):
         if SHAFT_POWER in self.engine_variables:
             direct_calc_vars.append(SHAFT_POWER)
 
+        independent_vars = [MACH, ALTITUDE, THROTTLE, HYBRID_THROTTLE]
+
         # stored information about packed data
-        mach_max_count = self.mach_max_count
-        alt_max_count = self.alt_max_count
         data_indices = self.data_indices
 
         # Throttle is already normalized from 0 to 1. Set flight idle to -0.1, which will
@@ -599,8 +587,6 @@ class EngineDeck(EngineModel):
         throttle_idle = -0.1
         hybrid_throttle_idle = 0
 
-        idle_points = {key: np.empty(0) for key in packed_data}
-
         # Normally, only one idle point is needed - however, when hybrid throttle is
         # present, there needs to be a sweep of points for a given Mach/alt/throttle
         # to satisfy the interpolator's requirements for at least 3 points per dimension
@@ -612,112 +598,99 @@ class EngineDeck(EngineModel):
             # How far apart the "fake" points should be from the actual idle point
             # This time, we want an arbitrarily small number
             h_tol = 1e-4
+            hybrid_throttle_range = np.linspace(hybrid_throttle_idle-h_tol,
+                                                hybrid_throttle_idle+h_tol,
+                                                num_points)
+        else:
+            hybrid_throttle_range = np.full(num_points, float(hybrid_throttle_idle))
+
+        # Idle points are generated for Mach, alt combinations that have data, and whose
+        # thrust at the lowest index is positive. All of these combinations ("cells")
+        # are computed at once. Indexing packed data with this mask returns one row per
+        # cell, in the same Mach, then altitude order as the packed data.
+        idle_cells = (data_indices > 0) & \
+            ~(packed_data[THRUST][:, :, 0] <= self.thrust_tol)
+        num_cells = np.count_nonzero(idle_cells)
+
+        data_counts = data_indices[idle_cells]
+        # if there is only one data point at a Mach, alt combination, use thrust
+        # fraction instead of extrapolation
+        # TODO idle currently calculated using lowest index data points - this is not
+        #      guaranteed to be at hybrid throttle idle point, could be negative
+        single_point = data_counts == 1
+        multi_point = ~single_point
+        extrapolate = np.any(multi_point)
+
+        idle_values = {}
+
+        # define known data for idle point (independent variables)
+        idle_values[MACH] = packed_data[MACH][idle_cells][:, 0]
+        idle_values[ALTITUDE] = packed_data[ALTITUDE][idle_cells][:, 0]
+        idle_values[THROTTLE] = np.full(num_cells, throttle_idle)
+
+        # calculate idle thrust, shaft powers as a percentage of max thrust at Mach, alt
+        # point (which is the only point for single point combinations)
+        # thrust, shaft powers do not get idle_min/max checks
+        for var in direct_calc_vars:
+            data = packed_data[var][idle_cells]
+            idle_calc_value = data[np.arange(num_cells), data_counts - 1] \
+                * idle_thrust_fract
+
+            idle_values[var] = idle_calc_value
+
+            if extrapolate:
+                # Calculate term for linear extrapolation - shaft power has highest
+                # "preference" since it is last in the list, followed by corrected
+                # shaft power then finally thrust. This is designed for compatibility
+                # with turboshaft engine decks in TurbopropModels.
+                # Only one extrapolation term can be used for all dependent vars
+                data = data[multi_point]
+
+                extrap_term = (idle_calc_value[multi_point] - data[:, 0]) / (
+                    data[:, 1] - data[:, 0])
+
+        # compute idle data
+        for key in packed_data:
+            # skip independent variables or thrust, which is already calculated
+            if key in independent_vars or key in direct_calc_vars:
+                continue
 
-        for M in range(mach_max_count):
-            for A in range(alt_max_count):
-                # if no data at this Mach, alt index combination, skip
-                if data_indices[M, A] == 0:
-                    continue
-
-                # don't generate flight idle points if thrust is already zero or negative
-                # at lowest index
-                if packed_data[THRUST][M, A, 0] <= self.thrust_tol:
-                    continue
-
-                # define known data for idle point (independent variables)
-                idle_points[MACH] = np.append(
-                    idle_points[MACH], [packed_data[MACH][M, A, 0]] * num_points)
-                idle_points[ALTITUDE] = np.append(
-                    idle_points[ALTITUDE], [packed_data[ALTITUDE][M, A, 0]] * num_points)
-                idle_points[THROTTLE] = np.append(
-                    idle_points[THROTTLE], [throttle_idle] * num_points)
-                if self.use_hybrid_throttle:
-                    hybrid_throttle_range = np.linspace(hybrid_throttle_idle-h_tol,
-                                                        hybrid_throttle_idle+h_tol,
-                                                        num_points)
-                    idle_points[HYBRID_THROTTLE] = np.append(
-                        idle_points[HYBRID_THROTTLE], hybrid_throttle_range)
-                else:
-                    idle_points[HYBRID_THROTTLE] = np.append(
-                        idle_points[HYBRID_THROTTLE], hybrid_throttle_idle)
-
-                # if there is only one data point at this Mach, alt combination, use
-                # thrust fraction instead of extrapolation
-                # TODO idle currently calculated using lowest index data points - this is not
-                #      guaranteed to be at hybrid throttle idle point, could be negative
-                if data_indices[M, A] == 1:
-                    for key in packed_data:
-                        if key not in [
-                                MACH,
-                                ALTITUDE,
-                                THROTTLE,
-                                HYBRID_THROTTLE] + direct_calc_vars:
-                            idle_value = packed_data[key][M, A, 0] * idle_thrust_fract
-                            var_min = packed_data[key][M, A, -1] * idle_min_fract
-                            var_max = packed_data[key][M, A, -1] * idle_max_fract
-
-                            if idle_value < var_min:
-                                idle_value = var_min
-                            elif idle_value > var_max:
-                                idle_value = var_max
-
-                            idle_points[key] = np.append(idle_points[key],
-                                                         [idle_value] * num_points)
-                            # add Mach, alt combination to idle_points with idle power
-                            # codes
-
-                    # thrust, shaft powers do not get idle_min/max checks
-                    for var in direct_calc_vars:
-                        idle_points[var] = np.append(idle_points[var],
-                                                     [[packed_data[var][M, A, 0]
-                                                       * idle_thrust_fract]] * num_points)
-                    # move to next data point
-                    continue
-
-                # calculate idle thrust, shaft powers as a percentage of max thrust at Mach, alt point
-                for var in direct_calc_vars:
-                    idle_calc_value = packed_data[var][M, A, data_indices[M, A] - 1]\
-                        * idle_thrust_fract
-
-                    # add this point to idle_points
-                    idle_points[var] = np.append(idle_points[var],
-                                                 [idle_calc_value] * num_points)
-
-                    # Calculate term for linear extrapolation - shaft power has highest
-                    # "preference" since it is last in the list, followed by corrected
-                    # shaft power then finally thrust. This is designed for compatibility
-                    # with turboshaft engine decks in TurbopropModels.
-                    # Only one extrapolation term can be used for all dependent vars
-                    extrap_term = (idle_calc_value - packed_data[var][M, A, 0]) / (
-                        packed_data[var][M, A, 1] - packed_data[var][M, A, 0])
-
-                # compute idle data
-                for key in packed_data:
-                    # skip independent variables or thrust, which is already calculated
-                    if key not in [
-                            MACH,
-                            ALTITUDE,
-                            THROTTLE,
-                            HYBRID_THROTTLE] + direct_calc_vars:
-                        # extrapolate to idle from lowest two throttle points in data
-                        idle_value = _extrapolate(packed_data[key][M, A])
-
-                        # idle cannot be below or above user-set limits
-                        var_min = packed_data[key][M, A, -1] * idle_min_fract
-                        var_max = packed_data[key][M, A, -1] * idle_max_fract
-
-                        if idle_value < var_min:
-                            idle_value = var_min
-                        elif idle_value > var_max:
-                            idle_value = var_max
-
-                        # store newly computed idle point
-                        idle_points[key] = np.append(idle_points[key],
-                                                     [idle_value] * num_points)
+            data = packed_data[key][idle_cells]
+
+            idle_value = np.empty(num_cells)
+            idle_value[single_point] = data[single_point, 0] * idle_thrust_fract
+
+            if extrapolate:
+                # extrapolate to idle from lowest two throttle points in data
+                y0 = data[multi_point, 0]
+                y1 = data[multi_point, 1]
+
+                rvalue = y0 + (y1 - y0) * extrap_term
+                rvalue[(y0 == 0) & (y1 == 0)] = 0
+
+                idle_value[multi_point] = rvalue
+
+            # idle cannot be below or above user-set limits
+            var_min = data[:, -1] * idle_min_fract
+            var_max = data[:, -1] * idle_max_fract
+
+            idle_value = np.where(idle_value < var_min, var_min,
+                                  np.minimum(idle_value, var_max))
+
+            idle_values[key] = idle_value
+
+        # each Mach, alt combination gets num_points identical idle points, except for
+        # the hybrid throttle sweep
+        idle_points = {}
+        for key in packed_data:
+            if key == HYBRID_THROTTLE:
+                idle_points[key] = np.tile(hybrid_throttle_range, num_cells)
+            else:
+                idle_points[key] = np.repeat(idle_values[key], num_points)
 
         # add idle points to data
         for key in packed_data:
-            self.data[key] = np.append(self.data[key], idle_points[key])
+            self.data[key] = np.concatenate((self.data[key], idle_points[key]))
 
         # update model length
         self.model_length = len(self.data[ALTITUDE])
@@ -754,10 +727,12 @@ class EngineDeck(EngineModel):
         engine = om.MetaModelSemiStructuredComp(
             method=interp_method, extrapolate=True, vec_size=num_nodes)
 
-        units = default_units
-        for key in self.engine_variables:
-            units[key] = self.engine_variables[key]
-        self.engine_variable_units = units
+        # engine variables are final once setup is complete, so units are only merged
+        # once, without modifying the shared default units
+        units = self.engine_variable_units
+        if units is None:
+            units = self.engine_variable_units = {**default_units,
+                                                  **self.engine_variables}
 
         # add inputs and outputs to interpolator
         engine.add_input(Dynamic.Mission.MACH,
@@ -865,14 +840,15 @@ class EngineDeck(EngineModel):
                 fixed_throttles = om.IndepVarComp()
                 if self.global_throttle:
                     fixed_throttles.add_output('throttle_max',
-                                               val=np.ones(num_nodes) *
-                                               self.throttle_max,
+                                               val=np.full(num_nodes, self.throttle_max,
+                                                           dtype=float),
                                                units='unitless',
                                                desc='Engine maximum throttle')
                 if self.global_hybrid_throttle and self.use_hybrid_throttle:
                     fixed_throttles.add_output('hybrid_throttle_max',
-                                               val=np.ones(num_nodes) *
-                                               self.hybrid_throttle_max,
+                                               val=np.full(num_nodes,
+                                                           self.hybrid_throttle_max,
+                                                           dtype=float),
                                                units='unitless',
                                                desc='Engine maximum hybrid throttle')
             if not (self.global_throttle or (self.global_hybrid_throttle
@@ -882,16 +858,10 @@ class EngineDeck(EngineModel):
                                                                   vec_size=num_nodes)
 
                 packed_data = self.packed_data
-                mach_table = np.array([])
-                alt_table = np.array([])
-
-                for M in range(self.mach_max_count):
-                    for A in range(self.alt_max_count):
-                        if self.data_indices[M, A] != 0:
-                            mach_table = np.append(
-                                mach_table, packed_data[MACH][M, A, 0])
-                            alt_table = np.append(
-                                alt_table, packed_data[ALTITUDE][M, A, 0])
+                # one table entry per Mach, alt combination that has data
+                cells = self.data_indices != 0
+                mach_table = packed_data[MACH][cells][:, 0]
+                alt_table = packed_data[ALTITUDE][cells][:, 0]
 
                 # add inputs and outputs to interpolator
                 interp_throttles.add_input(Dynamic.Mission.MACH,
@@ -1097,23 +1067,20 @@ class EngineDeck(EngineModel):
         if Aircraft.Engine.REFERENCE_SLS_THRUST not in engine_mapping:
             alt_tol = self.alt_tol
             mach_tol = self.mach_tol
+            altitude = self.data[ALTITUDE]
+            mach = self.data[MACH]
             # NOTE This fails if there is no data point at SLS (within tolerance)
-            sea_level_idx = (np.intersect1d(
-                np.where(-alt_tol < self.data[ALTITUDE])[0],
-                np.where(self.data[ALTITUDE] <= alt_tol)[0]))
-            static_idx = (np.intersect1d(
-                np.where(-mach_tol < self.data[MACH]),
-                np.where(self.data[MACH] < self.mach_tol)))
-            sls_idx = np.intersect1d(sea_level_idx, static_idx)
-
-            if sls_idx.size == 0:
+            sls_mask = (-alt_tol < altitude) & (altitude <= alt_tol) & \
+                (-mach_tol < mach) & (mach < mach_tol)
+
+            if not sls_mask.any():
                 raise UserWarning('Could not find sea-level static max thrust point for '
                                   f'EngineDeck <{self.name}>. Please review the data file '
                                   f'<{self.get_val(Aircraft.Engine.DATA_FILE)}> or '
                                   'manually specify Aircraft.Engine.REFERENCE_SLS_THRUST '
                                   'in EngineDeck options')
 
-            reference_sls_thrust = max(self.data[THRUST][sls_idx])
+            reference_sls_thrust = self.data[THRUST][sls_mask].max()
 
             self.set_val(Aircraft.Engine.REFERENCE_SLS_THRUST,
                          reference_sls_thrust, units=self.engine_variables[THRUST])
@@ -1188,7 +1155,7 @@ class EngineDeck(EngineModel):
         Normalization can be "global" (using max and min values from entire data set), or
         "local" (using the max and min values from each individual flight condition).
         """
-        def _hybrid_throttle_norm(hybrid_throttle_list):
+        def _hybrid_throttle_norm(hybrid_throttle, valid=True):
             """
             Normalize hybrid throttle to the scale:
 
@@ -1200,82 +1167,88 @@ class EngineDeck(EngineModel):
             values are provided in engine data. Positive normalized hybrid throttle values
             only appear if positive hybrid throttle values are provided in engine data.
 
+            Each row (along the last axis) of hybrid throttle data is normalized
+            separately, using only the entries flagged as valid.
+
             Parameters
             ----------
-            hybrid_throttle_list : (list, numpy.ndarray)
+            hybrid_throttle : (list, numpy.ndarray)
                 Hybrid throttle data to be normalized.
+            valid : (bool, numpy.ndarray)
+                Flags which entries of hybrid_throttle contain data. Defaults to all
+                entries.
 
             Returns
             -------
-            norm_hybrid_list : numpy.ndarray
-                Normalized hybrid throttle data from hybrid_throttle_list.
+            norm_hybrid_throttle : numpy.ndarray
+                Normalized hybrid throttle data from hybrid_throttle.
             """
-            norm_hybrid_list = np.array(hybrid_throttle_list)
+            hybrid_throttle = np.asarray(hybrid_throttle, dtype=float)
             # Split throttle into positive and negative components
-            # (track index to preserve order)
             # Throttle points at zero do not need to be tracked - they are already
             # "normalized", and zero is always assumed to be in the normalization range
             # (max or min)
-            hybrid_throttle_neg_idx = np.where(norm_hybrid_list < 0)
-            if not hybrid_throttle_neg_idx[0].size == 0:
-                hybrid_throttle_neg = norm_hybrid_list[hybrid_throttle_neg_idx]
-
-                # normalize negative component from -1 to 0
-                hybrid_throttle_neg_norm = normalize(hybrid_throttle_neg, maximum=0) - 1
-                norm_hybrid_list[hybrid_throttle_neg_idx] = hybrid_throttle_neg_norm
-
-            hybrid_throttle_pos_idx = np.where(norm_hybrid_list > 0)
-            if not hybrid_throttle_pos_idx[0].size == 0:
-                hybrid_throttle_pos = norm_hybrid_list[hybrid_throttle_pos_idx]
-
-                # normalize positive component from 0 to 1
-                hybrid_throttle_pos_norm = normalize(hybrid_throttle_pos, minimum=0)
-
-                norm_hybrid_list[hybrid_throttle_pos_idx] = hybrid_throttle_pos_norm
-
-            return norm_hybrid_list
-
-        normalized_throttle = np.array([])
-        normalized_hybrid_throttle = np.array([])
-        throttle_min = np.array([])
-        throttle_max = np.array([])
+            negative = valid & (hybrid_throttle < 0)
+            positive = valid & (hybrid_throttle > 0)
+
+            hybrid_throttle_min = np.min(hybrid_throttle, axis=-1, where=negative,
+                                         initial=0, keepdims=True)
+            hybrid_throttle_max = np.max(hybrid_throttle, axis=-1, where=positive,
+                                         initial=0, keepdims=True)
+
+            # normalize negative component from -1 to 0, and positive component from
+            # 0 to 1. Rows without a negative or positive component divide by zero in
+            # the unused branch, so those warnings are suppressed
+            with np.errstate(divide='ignore', invalid='ignore'):
+                norm_hybrid_throttle = np.where(
+                    negative,
+                    (hybrid_throttle - hybrid_throttle_min) / (0 - hybrid_throttle_min) - 1,
+                    np.where(positive, hybrid_throttle / hybrid_throttle_max,
+                             hybrid_throttle))
+
+            return norm_hybrid_throttle
 
         # information on packed data
         packed_throttle = self.packed_data[THROTTLE]
         packed_hybrid_throttle = self.packed_data[HYBRID_THROTTLE]
         data_indices = self.data_indices
 
-        # for each unique flight condition...
-        for M in range(self.mach_max_count):
-            for A in range(self.alt_max_count):
-                if data_indices[M, A] == 0:
-                    # skip point if there is no data
-                    continue
-
-                if not self.global_throttle:
-                    throttle_list = normalize(
-                        packed_throttle[M, A][:data_indices[M, A]+1])
-                    # normalize throttles for this flight condition from 0 to 1
-                    normalized_throttle = np.append(normalized_throttle, throttle_list)
-                    throttle_min = np.append(throttle_min, min(throttle_list))
-                    throttle_max = np.append(throttle_max, max(throttle_list))
-
-                if not self.global_hybrid_throttle and self.use_hybrid_throttle:
-                    # normalize hybrid throttles for this flight condition
-                    hybrid_throttle_list = _hybrid_throttle_norm(
-                        packed_hybrid_throttle[M, A][:data_indices[M, A]+1])
-                    normalized_hybrid_throttle = np.append(
-                        normalized_hybrid_throttle, hybrid_throttle_list)
-                    hybrid_throttle_min = np.append(
-                        hybrid_throttle_min, min(hybrid_throttle_list))
-                    hybrid_throttle_max = np.append(
-                        hybrid_throttle_max, max(hybrid_throttle_list))
+        # Local normalization is done for all flight conditions at once. Each row holds
+        # the packed data for one flight condition (Mach, alt combination) that has data,
+        # in the same order as the unpacked data. Only the first data_indices + 1 entries
+        # in each row are flagged as valid data.
+        cells = data_indices > 0
+        valid = np.arange(self.data_max_count) <= data_indices[cells][:, np.newaxis]
+
+        if not self.global_throttle:
+            # normalize throttles for each flight condition from 0 to 1
+            throttle = packed_throttle[cells]
+            throttle_min = np.min(throttle, axis=1, where=valid, initial=np.inf,
+                                  keepdims=True)
+            throttle_max = np.max(throttle, axis=1, where=valid, initial=-np.inf,
+                                  keepdims=True)
+
+            throttle = (throttle - throttle_min) / (throttle_max - throttle_min)
+
+            normalized_throttle = throttle[valid]
+            throttle_min = np.min(throttle, axis=1, where=valid, initial=np.inf)
+            throttle_max = np.max(throttle, axis=1, where=valid, initial=-np.inf)
+
+        if not self.global_hybrid_throttle and self.use_hybrid_throttle:
+            # normalize hybrid throttles for each flight condition
+            hybrid_throttle = _hybrid_throttle_norm(packed_hybrid_throttle[cells], valid)
+
+            normalized_hybrid_throttle = hybrid_throttle[valid]
+            hybrid_throttle_min = np.min(hybrid_throttle, axis=1, where=valid,
+                                         initial=np.inf)
+            hybrid_throttle_max = np.max(hybrid_throttle, axis=1, where=valid,
+                                         initial=-np.inf)
 
         # store normalized throttle data
         if self.global_throttle:
             self.data[THROTTLE] = normalize(self.data[THROTTLE])
-            self.throttle_min = min(self.data[THROTTLE])
-            self.throttle_max = max(self.data[THROTTLE])
+            self.throttle_min = self.data[THROTTLE].min()
+            self.throttle_max = self.data[THROTTLE].max()
         else:
             self.data[THROTTLE] = normalized_throttle
             self.throttle_min = throttle_min
@@ -1286,8 +1259,8 @@ class EngineDeck(EngineModel):
             if self.global_hybrid_throttle:
                 norm_hybrid_throttle = _hybrid_throttle_norm(self.data[HYBRID_THROTTLE])
 
-                self.hybrid_throttle_min = min(self.data[HYBRID_THROTTLE])
-                self.hybrid_throttle_max = max(self.data[HYBRID_THROTTLE])
+                self.hybrid_throttle_min = self.data[HYBRID_THROTTLE].min()
+                self.hybrid_throttle_max = self.data[HYBRID_THROTTLE].max()
                 self.data[HYBRID_THROTTLE] = norm_hybrid_throttle
             else:
                 self.data[HYBRID_THROTTLE] = normalized_hybrid_throttle
@@ -1307,17 +1280,16 @@ class EngineDeck(EngineModel):
         # sort engine data to ensure independent variables are always in
         # ascending order as required by metamodel interpolator
 
-        # convert engine_data from dict to list so it can be sorted
-        sorted_values = np.array([engine_data[key] for key in engine_data]).transpose()
-
-        # Sort by mach, then altitude, then throttle, then hybrid throttle
-        sorted_values = sorted_values[np.lexsort(
+        # Sort by mach, then altitude, then throttle, then hybrid throttle. The same
+        # ordering is applied to each variable separately, so every sorted variable is
+        # its own contiguous array
+        sort_order = np.lexsort(
             [engine_data[HYBRID_THROTTLE],
              engine_data[THROTTLE],
              engine_data[ALTITUDE],
-             engine_data[MACH]])]
-        for idx, var in enumerate(engine_data):
-            engine_data[var] = sorted_values[:, idx]
+             engine_data[MACH]])
+        for var in engine_data:
+            engine_data[var] = engine_data[var][sort_order]
 
         self.data = engine_data
 
@@ -1339,25 +1311,29 @@ class EngineDeck(EngineModel):
         data_indices = self.data_indices
 
         packed_data = self.packed_data = {}
-        idx = 0
 
-        for key in self.data:
-            packed_data[key] = np.zeros((mach_max_count, alt_max_count, data_max_count))
+        # Sorted data is packed in order of Mach, then altitude. Each Mach, alt
+        # combination with data takes the next index+1 data points. Find the packed
+        # location of every data point once, then place each variable in one step
+        mach_idx, alt_idx = np.nonzero(data_indices)
+        counts = data_indices[mach_idx, alt_idx] + 1
+        offsets = np.cumsum(counts) - counts
 
-        for M in range(mach_max_count):
+        mach_idx = np.repeat(mach_idx, counts)
+        alt_idx = np.repeat(alt_idx, counts)
+        data_idx = np.arange(len(mach_idx)) - np.repeat(offsets, counts)
 
-            for A in range(alt_max_count):
-                if data_indices[M, A] == 0:
-                    # skip point if there is no data
-                    continue
+        keys = list(self.data)
+        unpacked_data = np.stack([self.data[key] for key in keys])
+        num_points = min(unpacked_data.shape[1], len(data_idx))
 
-                # number of data points is index+1
-                for D in range(data_indices[M, A] + 1):
-                    for key in self.data:
-                        unpacked_data = self.data[key]
-                        if idx < len(unpacked_data):
-                            packed_data[key][M, A, D] = unpacked_data[idx]
-                    idx += 1
+        # all variables share one contiguous array, each key maps to a view of it
+        packed = np.zeros((len(keys), mach_max_count, alt_max_count, data_max_count))
+        packed[:, mach_idx[:num_points], alt_idx[:num_points],
+               data_idx[:num_points]] = unpacked_data[:, :num_points]
+
+        for i, key in enumerate(keys):
+            packed_data[key] = packed[i]
 
     def _count_data(self):
         """
@@ -1370,81 +1346,69 @@ class EngineDeck(EngineModel):
             If insufficient number of altitude points (<2) provided for a given Mach
             number.
         """
-        mach_count = 0
-        # First mach number must have at least one altitude associated with it
-        alt_count = 1
-        max_alt_count = 0
-        # First mach number must have at least one data point associated with it
-        data_count = 1
-        max_data_count = 0
+        mach_numbers = self.data[MACH]
+        altitudes = self.data[ALTITUDE]
 
-        # data_indices stores how many data points there are for a given Mach/alt combo
-        data_indices = np.array([[]])
+        # Sorted data keeps identical Mach, alt pairs next to each other. Find each run of
+        # identical pairs and its length in one pass, so tolerance checks are only done
+        # once per run instead of once per data point
+        new_run = np.ones(self.model_length, dtype=bool)
+        new_run[1:] = (mach_numbers[1:] != mach_numbers[:-1]) | \
+            (altitudes[1:] != altitudes[:-1])
+        run_starts = np.flatnonzero(new_run)
+        run_lengths = np.diff(run_starts, append=self.model_length)
 
-        curr_mach = curr_alt = np.inf
+        # number of data points for each altitude (inner lists) of each Mach number
+        data_counts = []
 
-        mach_numbers = self.data[MACH]
-        altitudes = self.data[ALTITUDE]
+        curr_mach = curr_alt = np.inf
+        mach_tol = self.mach_tol
+        alt_tol = self.alt_tol
 
-        # Loop through data. Keep track of last unique value (curr_*) to compare each new
+        # Loop through runs. Keep track of last unique value (curr_*) to compare each new
         #   value with
-        # Count number of altitudes per mach, number of data points per
-        #   mach/altitude combination, compare with max_count
-        for idx in range(self.model_length):
-            mach_num = mach_numbers[idx]
-            alt = altitudes[idx]
+        for mach_num, alt, run_length in zip(mach_numbers[run_starts],
+                                             altitudes[run_starts],
+                                             run_lengths):
+            if math.isclose(mach_num, curr_mach, abs_tol=mach_tol):
 
-            if math.isclose(mach_num, curr_mach, abs_tol=self.mach_tol):
-
-                if math.isclose(alt, curr_alt, abs_tol=self.alt_tol):
-                    data_indices[mach_count - 1, alt_count - 1] = data_count
-                    data_count += 1
+                if math.isclose(alt, curr_alt, abs_tol=alt_tol):
+                    data_counts[-1][-1] += run_length
 
                 else:
                     # new altitude for this mach number, count it
                     curr_alt = alt
-                    alt_count += 1
-                    data_indices = extend_array(data_indices, [mach_count, alt_count])
-
-                    if data_count > max_data_count:
-                        max_data_count = data_count
-                    # new altitude means reset data counter
-                    data_count = 1
-                    # count data associated with new altitude
-                    data_indices[mach_count - 1, alt_count - 1] = 1
+                    data_counts[-1].append(run_length)
 
             else:
                 # new Mach number
                 # if there are less than two altitudes for this Mach number, quit
-                if alt_count < 2 and mach_count > 0:
+                if data_counts and len(data_counts[-1]) < 2:
                     raise UserWarning('Only one altitude provided for Mach number '
-                                      f'{mach_numbers[mach_count]:6.3f} in engine data file '
+                                      f'{mach_numbers[len(data_counts)]:6.3f} in engine '
+                                      'data file '
                                       f'<{self.get_val(Aircraft.Engine.DATA_FILE).name}>'
                                       )
 
-                # record and count mach numbers
+                # record mach number, new mach comes with new altitude
                 curr_mach = mach_num
-                mach_count += 1
-
-                # new mach comes with new altitude, record and count it
-                if alt_count > max_alt_count:
-                    max_alt_count = alt_count
-                # new mach means reset altitude counter
                 curr_alt = alt
-                alt_count = 1
-                data_indices = extend_array(data_indices, [mach_count, alt_count])
+                data_counts.append([run_length])
+
+        mach_count = len(data_counts)
+        alt_count = max((len(counts) for counts in data_counts), default=0)
 
-                if data_count > max_data_count:
-                    max_data_count = data_count
-                # new mach means reset data counter
-                data_count = 1
-                # count data associated with new altitude
-                data_indices[mach_count - 1, alt_count - 1] = 1
+        data_indices = np.zeros((mach_count, alt_count), dtype=int)
+        for M, counts in enumerate(data_counts):
+            data_indices[M, :len(counts)] = counts
 
         self.mach_max_count = mach_count
-        self.alt_max_count = max_alt_count
-        self.data_max_count = max_data_count
-        self.data_indices = data_indices.astype(int)
+        self.alt_max_count = alt_count
+        self.data_max_count = data_indices.max(initial=0)
+        # data_indices stores the index of the last data point for each Mach/alt combo
+        # (zero if there is no data). A single data point is stored as one, so it can
+        # be told apart from no data
+        self.data_indices = np.where(data_indices > 1, data_indices - 1, data_indices)
 
 
 #####################
@@ -1478,52 +1442,13 @@ def normalize(base_list, maximum=None, minimum=None):
     norm_list : numpy.ndarray
         Normalized data from base_list.
     """
+    base_list = np.asarray(base_list, dtype=float)
+
     if maximum is None:
-        maximum = max(base_list)
+        maximum = base_list.max()
     if minimum is None:
-        minimum = min(base_list)
+        minimum = base_list.min()
 
-    norm_list = np.array([(x - minimum) / (maximum - minimum) for x in base_list])
+    norm_list = (base_list - minimum) / (maximum - minimum)
 
     return norm_list
-
-
-def extend_array(inp_array, size):
-    """
-    Extends input array such that it is at least as large as the target size in
-    all dimensions. If input array is smaller in any dimension, extends input
-    array to match target size in that dimension. Works on arrays up to 3
-    dimensions. Returns copy of input array extended in required dimensions with newly
-    created points set to 0.
-
-    Parameters
-    ----------
-    inp_array : (list, numpy.ndarray)
-        Array that needs to be checked for expansion.
-    size : list
-        List containing desired minimum length of inp_array along each dimension.
-
-    Returns
-    -------
-    inp_array : numpy.ndarray
-        The provided array extended in the desired dimensions with with newly created
-        points set to 0.
-    """
-    # TODO may be built-in numpy functions that can replace this and support n dimensions
-    dims = np.array(np.shape(inp_array))
-    while size[0] > dims[0]:
-        inp_array = np.concatenate(
-            (inp_array, np.zeros((1, *dims[1:]))), 0)
-        dims[0] += 1
-    if len(dims) > 1:
-        while size[1] > dims[1]:
-            inp_array = np.concatenate(
-                (inp_array, np.zeros((dims[0], 1, *dims[2:]))), 1)
-            dims[1] += 1
-        if len(dims) > 2:
-            while size[2] > dims[2]:
-                inp_array = np.concatenate(
-                    (inp_array, np.zeros((*dims[:2], 1))), 2)
-                dims[2] += 1
-
-    return inp_array
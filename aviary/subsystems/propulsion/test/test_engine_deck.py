@@ -2,11 +2,15 @@ import csv
 import unittest
 from pathlib import Path
 
+import numpy as np
+
 from openmdao.utils.assert_utils import assert_near_equal
 
 from aviary.subsystems.propulsion.engine_deck import EngineDeck
 from aviary.subsystems.propulsion.utils import EngineModelVariables as keys
+from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.named_values import NamedValues
+from aviary.variable_info.variables import Aircraft
 from aviary.validation_cases.validation_data.flops_data.FLOPS_Test_Data import \
     FLOPS_Test_Data
 from aviary.subsystems.propulsion.utils import build_engine_deck
@@ -131,6 +135,102 @@ class EngineDeckTest(unittest.TestCase):
         assert_near_equal(thrust, expected_thrust, tolerance=tol)
         assert_near_equal(fuel_flow_rate, expected_fuel_flow_rate, tolerance=tol)
 
+    def test_net_thrust_check(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs']
+
+        mach_number = []
+        altitude = []
+        throttle = []
+        thrust = []
+        fuel_flow_rate = []
+
+        with open(Path(__file__).parents[0] / 'engine_model_test_data_turbofan_24k_1.csv') as file:
+            reader = csv.reader(file)
+            for row in reader:
+                mach_number.append(float(row[0]))
+                altitude.append(float(row[1]))
+                throttle.append(float(row[2]))
+                thrust.append(float(row[3]))
+                fuel_flow_rate.append(float(row[4]))
+
+        thrust = np.array(thrust)
+        ram_drag = np.full(len(thrust), 1000.0)
+
+        data_input = NamedValues()
+        data_input.set_val('mach', mach_number, 'unitless')
+        data_input.set_val('altitude', altitude, 'ft')
+        data_input.set_val('throttle', throttle, 'unitless')
+        data_input.set_val('gross_thrust', thrust + ram_drag, 'lbf')
+        data_input.set_val('ram_drag', ram_drag, 'lbf')
+        data_input.set_val('thrust', thrust, 'lbf')
+        data_input.set_val('fuel_flow', fuel_flow_rate, 'lbm/h')
+
+        # net thrust consistent with gross thrust and ram drag is accepted
+        EngineDeck('engine', aviary_values, data_input)
+
+        thrust[0] += 10.0
+        data_input.set_val('thrust', thrust, 'lbf')
+
+        with self.assertRaises(UserWarning):
+            EngineDeck('engine', aviary_values, data_input)
+
+    def test_count_data(self):
+        # the last Mach number has the most altitudes and the most data points per
+        # altitude, which must be included in the packed data
+        mach_number = []
+        altitude = []
+        throttle = []
+        for mach, altitudes, throttles in ((0.0, (0.0, 10000.0), (0.5, 1.0)),
+                                           (0.5, (0.0, 10000.0, 20000.0),
+                                            (0.25, 0.5, 1.0))):
+            for alt in altitudes:
+                for thr in throttles:
+                    mach_number.append(mach)
+                    altitude.append(alt)
+                    throttle.append(thr)
+
+        throttle = np.array(throttle)
+
+        data_input = NamedValues()
+        data_input.set_val('mach', mach_number, 'unitless')
+        data_input.set_val('altitude', altitude, 'ft')
+        data_input.set_val('throttle', throttle, 'unitless')
+        data_input.set_val('thrust', 10000.0 * throttle, 'lbf')
+        data_input.set_val('fuel_flow', 5000.0 * throttle, 'lbm/h')
+
+        options = AviaryValues()
+        options.set_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE, False)
+
+        model = EngineDeck('engine', options, data_input)
+
+        assert_near_equal(model.data_indices, [[1, 1, 0], [2, 2, 2]])
+        self.assertEqual(model.alt_max_count, 3)
+        self.assertEqual(model.data_max_count, 3)
+        assert_near_equal(model.packed_data[keys.ALTITUDE][1, 2], [20000.0] * 3)
+
+    def test_reuse_data_file(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs']
+
+        model = build_engine_deck(aviary_values)[0]
+        expected_thrust = model.data[keys.THRUST].copy()
+
+        # decks built from the same data file must not share data
+        model.data[keys.THRUST][:] = 0.0
+        model._original_data[keys.THRUST][:] = 0.0
+
+        model = build_engine_deck(aviary_values)[0]
+
+        assert_near_equal(model.data[keys.THRUST], expected_thrust, tolerance=1e-12)
+
+    def test_ignore_negative_thrust(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs'].deepcopy()
+        aviary_values.set_val(Aircraft.Engine.IGNORE_NEGATIVE_THRUST, True)
+
+        model = build_engine_deck(aviary_values)[0]
+
+        self.assertEqual(model.model_length, len(model.data[keys.ALTITUDE]))
+        self.assertTrue(all(model.data[keys.THRUST] >= 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -85,8 +85,9 @@ class ThrottleAllocator(om.ExplicitComponent):
             col = np.arange(b)
             rows = np.repeat(row, b)
             cols = np.tile(col, num_engine_type)
-            all_rows = np.tile(rows, nn) + a * np.repeat(np.arange(nn), a * b)
-            all_cols = np.tile(cols, nn) + b * np.repeat(np.arange(nn), a * b)
+            nodes = np.arange(nn)[:, np.newaxis]
+            all_rows = (rows + a * nodes).ravel()
+            all_cols = (cols + b * nodes).ravel()
             self.declare_partials(of=[Dynamic.Mission.THROTTLE], wrt=["throttle_allocations"],
                                   rows=all_rows, cols=all_cols)
 
@@ -100,6 +101,11 @@ class ThrottleAllocator(om.ExplicitComponent):
             self.declare_partials(of=["throttle_allocation_sum"], wrt=["throttle_allocations"],
                                   val=1.0)
 
+        # derivative of each engine throttle wrt the allocations, per unit aggregate
+        # throttle: identity for the allocated engines, -1 for the last engine
+        ne = num_engine_type - 1
+        self._mask = np.vstack((np.eye(ne), -np.ones(ne))).ravel()
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         nn = self.options['num_nodes']
         alloc_mode = self.options['throttle_allocation']
@@ -108,12 +114,12 @@ class ThrottleAllocator(om.ExplicitComponent):
         allocation = inputs["throttle_allocations"]
 
         if alloc_mode == ThrottleAllocation.DYNAMIC:
-            outputs[Dynamic.Mission.THROTTLE][:, :-
-                                              1] = np.einsum("i,ij->ij", agg_throttle, allocation)
+            outputs[Dynamic.Mission.THROTTLE][:, :-1] = \
+                agg_throttle[:, np.newaxis] * allocation
             sum_alloc = np.sum(allocation, axis=1)
         else:
-            outputs[Dynamic.Mission.THROTTLE][:, :-
-                                              1] = np.einsum("i,j->ij", agg_throttle, allocation)
+            outputs[Dynamic.Mission.THROTTLE][:, :-1] = \
+                np.outer(agg_throttle, allocation)
             sum_alloc = np.sum(allocation)
 
         outputs[Dynamic.Mission.THROTTLE][:, -1] = agg_throttle * (1.0 - sum_alloc)
@@ -130,30 +136,24 @@ class ThrottleAllocator(om.ExplicitComponent):
         allocation = inputs["throttle_allocations"]
 
         if alloc_mode == ThrottleAllocation.DYNAMIC:
-            sum_alloc = np.sum(allocation, axis=1)
-            allocs = np.vstack((allocation.T, 1.0 - sum_alloc))
-            partials[Dynamic.Mission.THROTTLE, "aggregate_throttle"] = allocs.T.ravel()
+            allocs = np.empty((nn, num_engine_type))
+            allocs[:, :-1] = allocation
+            allocs[:, -1] = 1.0 - np.sum(allocation, axis=1)
+            partials[Dynamic.Mission.THROTTLE, "aggregate_throttle"] = allocs.ravel()
 
             ne = num_engine_type - 1
-            mask1 = np.eye(ne)
-            mask2 = - np.ones(ne)
-            mask = np.vstack((mask1, mask2)).ravel()
-
-            deriv = np.outer(agg_throttle, mask).reshape((nn * (ne + 1), ne))
+            deriv = np.outer(agg_throttle, self._mask).reshape((nn * (ne + 1), ne))
             partials[Dynamic.Mission.THROTTLE, "throttle_allocations"] = deriv.ravel()
 
         else:
-            sum_alloc = np.sum(allocation)
-            allocs = np.hstack((allocation, 1.0 - sum_alloc))
+            allocs = np.empty(num_engine_type)
+            allocs[:-1] = allocation
+            allocs[-1] = 1.0 - np.sum(allocation)
             partials[Dynamic.Mission.THROTTLE,
                      "aggregate_throttle"] = np.tile(allocs, nn)
 
             ne = num_engine_type - 1
-            mask1 = np.eye(ne)
-            mask2 = - np.ones(ne)
-            mask = np.vstack((mask1, mask2)).ravel()
-
-            deriv = np.outer(agg_throttle, mask).reshape((nn * (ne + 1), ne))
+            deriv = np.outer(agg_throttle, self._mask).reshape((nn * (ne + 1), ne))
             partials[Dynamic.Mission.THROTTLE, "throttle_allocations"] = deriv
 
         # sum_alloc = np.sum(allocation)
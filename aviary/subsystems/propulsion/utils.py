@@ -196,51 +196,30 @@ class UncorrectData(om.Group):
     def setup(self):
         num_nodes = self.options['num_nodes']
 
+        # pressure and temperature correction terms are computed in the same component
+        # as the uncorrected data, so they are not stored as separate variables
         self.add_subsystem(
-            'pressure_term',
+            'uncorrection',
             om.ExecComp(
-                'delta_T = (P0 * (1 + .2*mach**2)**3.5) / P_amb',
-                delta_T={'units': "unitless", 'shape': num_nodes},
+                'uncorrected_data = corrected_data * ('
+                '(P0 * (1 + .2*mach**2)**3.5) / P_amb'
+                ' + (T0 * (1 + .2*mach**2) / T_amb)**.5)',
+                uncorrected_data={'units': "hp", 'shape': num_nodes},
+                corrected_data={'units': "hp", 'shape': num_nodes},
                 P0={'units': 'psi', 'shape': num_nodes},
-                mach={'units': 'unitless', 'shape': num_nodes},
-                P_amb={'val': np.full(num_nodes, 14.696), 'units': 'psi', },
-                has_diag_partials=True,
-            ),
-            promotes_inputs=[
-                ('P0', Dynamic.Mission.STATIC_PRESSURE),
-                ('mach', Dynamic.Mission.MACH),
-            ],
-            promotes_outputs=['delta_T'],
-        )
-
-        self.add_subsystem(
-            'temperature_term',
-            om.ExecComp(
-                'theta_T = T0 * (1 + .2*mach**2)/T_amb',
-                theta_T={'units': "unitless", 'shape': num_nodes},
                 T0={'units': 'degR', 'shape': num_nodes},
                 mach={'units': 'unitless', 'shape': num_nodes},
+                P_amb={'val': np.full(num_nodes, 14.696), 'units': 'psi', },
                 T_amb={'val': np.full(num_nodes, 518.67), 'units': 'degR', },
                 has_diag_partials=True,
             ),
             promotes_inputs=[
+                ('P0', Dynamic.Mission.STATIC_PRESSURE),
                 ('T0', Dynamic.Mission.TEMPERATURE),
                 ('mach', Dynamic.Mission.MACH),
+                'corrected_data',
             ],
-            promotes_outputs=['theta_T'],
-        )
-
-        self.add_subsystem(
-            'uncorrection',
-            om.ExecComp(
-                'uncorrected_data = corrected_data * (delta_T + theta_T**.5)',
-                uncorrected_data={'units': "hp", 'shape': num_nodes},
-                delta_T={'units': "unitless", 'shape': num_nodes},
-                theta_T={'units': "unitless", 'shape': num_nodes},
-                corrected_data={'units': "hp", 'shape': num_nodes},
-                has_diag_partials=True,
-            ),
-            promotes=['*']
+            promotes_outputs=['uncorrected_data'],
         )
 
 
@@ -42,7 +42,11 @@ def setup_options(priority_data, backfill_data):
 
 class PreMissionTestCase(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # The model topology is the same for every test, so it is only built and set
+        # up once. Tests must treat cls.prob as topology-frozen; call prob.setup()
+        # explicitly if a test needs to change the model.
 
         # set up inputs such that GASP inputs take priority
 
@@ -54,7 +58,7 @@ class PreMissionTestCase(unittest.TestCase):
         FLOPS_input = flops_inputs
         GASP_input = V3_bug_fixed_options
 
-        self.prob = om.Problem()
+        cls.prob = om.Problem()
 
         input_options = setup_options(GASP_input, FLOPS_input)
 
@@ -80,7 +84,7 @@ class PreMissionTestCase(unittest.TestCase):
 
         core_subsystems = [prop, geom, mass, aero]
 
-        self.prob.model.add_subsystem(
+        cls.prob.model.add_subsystem(
             'pre_mission',
             CorePreMission(aviary_options=input_options,
                            subsystems=core_subsystems),
@@ -90,36 +94,39 @@ class PreMissionTestCase(unittest.TestCase):
 
         # set defaults for all the vars
         val, units = input_options.get_item(Aircraft.Engine.SCALED_SLS_THRUST)
-        self.prob.model.pre_mission.set_input_defaults(
+        cls.prob.model.pre_mission.set_input_defaults(
             Aircraft.Engine.SCALED_SLS_THRUST, val=val, units=units)
 
         for (key, (val, units)) in get_items(GASP_input):
             try:
                 if not BaseMetaData[key]['option']:
-                    self.prob.model.set_input_defaults(key, val, units)
+                    cls.prob.model.set_input_defaults(key, val, units)
             except KeyError:
                 continue
 
         for (key, (val, units)) in get_items(V3_bug_fixed_non_metadata):
-            self.prob.model.set_input_defaults(key, val=val, units=units)
+            cls.prob.model.set_input_defaults(key, val=val, units=units)
 
-        self.prob.model.add_subsystem(
+        cls.prob.model.add_subsystem(
             'input_sink',
             VariablesIn(aviary_options=input_options),
             promotes_inputs=['*'],
             promotes_outputs=['*']
         )
 
-        set_aviary_initial_values(self.prob.model, input_options)
-        self.prob.setup(check=False, force_alloc_complex=True)
-        self.prob.set_solver_print(2)
+        set_aviary_initial_values(cls.prob.model, input_options)
+        cls.prob.setup(check=False, force_alloc_complex=True)
+        cls.prob.set_solver_print(2)
+
+        cls.input_options = input_options
 
+    def setUp(self):
         # Initial guess for gross mass.
         # We set it to an unconverged value to test convergence.
         self.prob.set_val(Mission.Design.GROSS_MASS, val=1000.0)
 
         # Set inital values for all variables.
-        for (key, (val, units)) in get_items(input_options):
+        for (key, (val, units)) in get_items(self.input_options):
             try:
                 self.prob.set_val(key, val, units)
             except KeyError:
@@ -355,6 +362,3 @@ class PreMissionTestCase(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
-    # test = PreMissionTestCase()
-    # test.setUp()
-    # test.test_GASP_mass_FLOPS_everything_else()
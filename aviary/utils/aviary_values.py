@@ -16,6 +16,7 @@ OptionalValueAndUnits : type alias
 class AviaryValues
     define a collection of named values with associated units
 '''
+import functools
 from enum import EnumMeta
 
 import numpy as np
@@ -122,18 +123,19 @@ class AviaryValues(NamedValues):
         if key in meta_data.keys():
             expected_units = meta_data[key]['units']
 
-            try:
-                # NOTE the value here is unimportant, we only care if OpenMDAO will
-                # convert the units
-                _convert_units(10, expected_units, units)
-            except ValueError:
+            error = _units_conversion_error(expected_units, units)
+
+            if error is None:
+                return
+
+            if error is ValueError:
                 raise ValueError(
                     f'The units {units} which you have provided for {key} are invalid.')
-            except TypeError:
+            if error is TypeError:
                 raise TypeError(
                     f'The base units of {key} are {expected_units}, and you have tried to set {key} with units of {units}, which are not compatible.')
-            except BaseException:
-                raise KeyError('There is an unknown error with your units.')
+
+            raise KeyError('There is an unknown error with your units.')
 
     def _is_iterable(self, val):
         return isinstance(val, _valid_iterables)
@@ -151,3 +153,28 @@ class AviaryValues(NamedValues):
 
 
 _valid_iterables = (list, np.ndarray, tuple)
+
+
+@functools.lru_cache(maxsize=256)
+def _units_conversion_error(from_units, to_units):
+    '''
+    Return the type of error raised by OpenMDAO when converting between the specified
+    units, or None if the units are compatible.
+
+    Only a handful of unit pairs are ever checked, so the result of parsing them is
+    cached instead of repeated for every value that is set.
+    '''
+    try:
+        # NOTE the value here is unimportant, we only care if OpenMDAO will
+        # convert the units
+        _convert_units(10, from_units, to_units)
+    except ValueError:
+        return ValueError
+    except TypeError:
+        return TypeError
+    # BaseException subclasses such as KeyboardInterrupt are not caught, so they are
+    # never cached
+    except Exception:
+        return Exception
+
+    return None
@@ -12,6 +12,9 @@ from aviary.utils.named_values import get_items, get_keys
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
 
+# delimiters between data entries, along with any trailing whitespace
+_delimiters = re.compile(r'[;,]\s*')
+
 
 def read_data_file(filename: (str, Path), metadata=None, aliases=None,
                    save_comments=False):
@@ -71,7 +74,7 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
                 line_data = line_data[:index]
 
             # split by delimiters, remove whitespace and newline characters
-            line_data = re.split(r'[;,]\s*', line_data.strip())
+            line_data = _delimiters.split(line_data.strip())
 
             # ignore empty lines
             if not line_data or line_data == ['']:
@@ -147,6 +150,8 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
                     if len(header) > 0:
                         check_for_header = False
                         raw_data = {key: [] for key in header.keys()}
+                        # pair each valid column index with the list its data goes in
+                        columns = list(zip(valid_indices, raw_data.values()))
                         continue
 
                 # only raise error if not checking for header, or invalid header found
@@ -159,9 +164,8 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
             check_for_header = False
 
             # pull out data for each valid header, ignore other columns
-            for idx, variable in enumerate(header.keys()):
-                # valid_indices matches dictionary order, pull data from correct column
-                raw_data[variable].append(line_data[valid_indices[idx]])
+            for index, column in columns:
+                column.append(line_data[index])
 
     # store data in NamedValues object
     for variable in header.keys():
@@ -148,9 +148,12 @@ class NamedValues(Collection):
 
         val, old_units = item
 
+        if old_units == units:
+            return val
+
         if isinstance(val, tuple):
             val = tuple(_convert_units(v, old_units, units) for v in val)
-        elif old_units != units:
+        else:
             val = _convert_units(val, old_units, units)
 
         return val
@@ -69,7 +69,7 @@ def PropDataConverter(input_file, output_file, data_format: PropMapType):
 
         # data needs to be string so column length can be easily found later
         for var in data:
-            data[var] = np.array([str(item) for item in data[var]])
+            data[var] = data[var].astype(str)
 
     else:
         quit("Invalid propeller map format provided")
@@ -128,7 +128,7 @@ def _read_pm_table(f, cmts):
     independent variables (advanced ratio (J), Mach number and power coefficient) 
     and the final column for thrust coefficient.
     """
-    tab_data = None
+    maps = []
     is_turbo_prop = True
 
     # table title
@@ -140,18 +140,14 @@ def _read_pm_table(f, cmts):
     f.readline()
 
     for i in range(nmaps):
-        map_data = _read_map(f, is_turbo_prop)
+        maps.append(_read_map(f, is_turbo_prop))
 
         # blank line following all but the last map in the table
         if i < nmaps - 1:
             f.readline()
 
-        if tab_data is None:
-            tab_data = map_data
-        else:
-            tab_data = np.r_[tab_data, map_data]
-
-    return tab_data
+    # join all maps at once instead of growing the table with each map
+    return np.concatenate(maps)
 
 
 def _setup_PMC_parser(parser):
@@ -39,6 +39,19 @@ class TestCreateVehicle(unittest.TestCase):
         self.assertIsNotNone(aircraft_values)
         self.assertIsNotNone(initial_guesses)
 
+    def test_reload_warns_unknown_variable(self):
+        """Test that reloading a CSV file repeats the warnings from parsing it."""
+        original_file_path = 'models/test_aircraft/aircraft_for_bench_FwFm.csv'
+        modified_file_path = 'unknown_variable_aircraft.csv'
+
+        with open(get_path(original_file_path), 'r') as original_file, open(modified_file_path, 'w') as modified_file:
+            modified_file.writelines(original_file.readlines())
+            modified_file.write('\naircraft:bogus:thing,1.0\n')
+
+        for _ in range(2):
+            with self.assertWarnsRegex(UserWarning, 'aircraft:bogus:thing'):
+                create_vehicle(modified_file_path)
+
 
 if __name__ == '__main__':
     unittest.main()
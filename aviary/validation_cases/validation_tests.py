@@ -1,4 +1,5 @@
 
+import functools
 import warnings
 from enum import Enum
 
@@ -297,15 +298,12 @@ def get_flops_inputs(case_name: str, keys: str = None, preprocess: bool = False)
         If true, the input data will be passed through preprocess_options() to
         fill in any missing options before being returned. The default is False.
     """
-    try:
-        flops_data: dict = FLOPS_Test_Data[case_name]
-    except KeyError:
-        flops_data: dict = FLOPS_Lacking_Test_Data[case_name]
-
-    flops_inputs_copy: AviaryValues = flops_data['inputs'].deepcopy()
     if preprocess:
-        preprocess_options(flops_inputs_copy,
-                           engine_models=build_engine_deck(flops_inputs_copy))
+        # preprocessing only depends on the case, so it is done once per case
+        flops_inputs_copy = _get_preprocessed_flops_inputs(case_name).deepcopy()
+    else:
+        flops_inputs_copy = _get_flops_case_data(case_name)['inputs'].deepcopy()
+
     if keys is None:
         return flops_inputs_copy
     keys_list = _assure_is_list(keys)
@@ -375,6 +373,25 @@ def print_case(testcase_func, param_num, param: param):
     return 'test_case_' + param.args[0]
 
 
+def _get_flops_case_data(case_name: str) -> dict:
+    try:
+        flops_data: dict = FLOPS_Test_Data[case_name]
+    except KeyError:
+        flops_data: dict = FLOPS_Lacking_Test_Data[case_name]
+
+    return flops_data
+
+
+@functools.lru_cache(maxsize=None)
+def _get_preprocessed_flops_inputs(case_name: str) -> AviaryValues:
+    # The returned object is shared between calls: callers must copy it before use.
+    flops_inputs: AviaryValues = _get_flops_case_data(case_name)['inputs'].deepcopy()
+
+    preprocess_options(flops_inputs, engine_models=build_engine_deck(flops_inputs))
+
+    return flops_inputs
+
+
 def _assure_is_list(keys, backup=None):
 
     if isinstance(keys, str):